@@ -1,19 +1,75 @@
 import serial
 import serial.tools.list_ports
+import sys
 import time
 import json
-import requests
+import re
 import asyncio
 import websockets
+import socket
+import struct
 import threading
+import queue
+import os
 from typing import Dict, List, Tuple, Optional
+from collections import deque
 from pathlib import Path
-from queue import Queue
 import tkinter as tk
 from tkinter import ttk
-from obswebsocket import obsws, requests
+from obswebsocket import obsws, requests as obs_requests
 import base64
 
+try:
+    import orjson  # Optional C-accelerated JSON
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # Optional vectorized decode for large CTS backlogs
+except ImportError:
+    np = None
+
+try:
+    from numba import njit  # Optional JIT for the CTS stream parser (needs NumPy)
+except ImportError:
+    njit = None
+
+try:
+    import uvloop  # Optional libuv event loop (not available on Windows)
+except ImportError:
+    uvloop = None
+
+
+def _parse_cts_chunk(data, display, data_readout, channel, control_threshold, clear_threshold, space):
+    """CTS Gen7 stream state machine over a uint8 array, writing into a (channels, chars) uint8 view of the display.
+
+    Mirrors SwimLiveSystem._process_bytes. Returns the new state packed as channel * 2 + data_readout.
+    """
+    channels, chars_per_channel = display.shape
+    for i in range(data.shape[0]):
+        byte_in = data[i]
+        if byte_in > control_threshold:
+            data_readout = (byte_in & 1) == 0
+            channel = ((byte_in >> 1) & 0x1F) ^ 0x1F
+            if channel < channels and byte_in > clear_threshold:
+                display[channel, :] = space
+        elif data_readout:
+            segment_num = byte_in >> 4
+            if segment_num >= chars_per_channel:
+                continue
+            segment_data = byte_in & 0x0F
+            if channel > 0 and segment_data == 0:
+                display[channel, segment_num] = space
+            else:
+                display[channel, segment_num] = (segment_data ^ 0x0F) + 48
+    return channel * 2 + (1 if data_readout else 0)
+
+
+# Compiled to machine code (GIL released) when Numba is installed. No on-disk cache:
+# the frozen SwimLive.exe ships without the .py source Numba would locate it by.
+_parse_cts_chunk_jit = njit(nogil=True)(_parse_cts_chunk) if njit is not None and np is not None else None
+
+
 class SwimLiveSystem:
     """
     Unified system combining CTS Gen7 reader, COM port file receiver, and HTML generation.
@@ -26,20 +82,66 @@ class SwimLiveSystem:
     CHARS_PER_CHANNEL = 8
     CONTROL_BYTE_THRESHOLD = 0x7F
     CLEAR_CHANNEL_THRESHOLD = 190
+    NUMPY_MIN_CHUNK = 1024  # Below this the plain loop beats NumPy's per-call overhead
+    JIT_MIN_CHUNK = 64  # Below this the plain loop beats the JIT call's argument boxing
     
     # Channel mappings
     EVENT_HEAT_CHANNEL = 0x0C
     RACE_TIME_CHANNEL = 0x00
     LANE_CHANNELS = range(0x01, 0x08)
 
+    # JSON keys for lanes 1-8 (index 0 unused), so hot loops don't rebuild str(lane)
+    LANE_KEYS = tuple(str(i) for i in range(9))
+
+    # Per-lane state at the start of a heat, indexed by lane number (index 0 unused)
+    _NO_FINISH_TIMES = ("",) * 9
+    _NO_TIME_COUNTS = (0,) * 9
+
+    # Place-slot classification for a lane channel
+    PLACE_EMPTY = 0
+    PLACE_DIGIT = 1
+    PLACE_DQ = 2  # Non-digit code in the place slot
+
     # Network settings
     WEBSOCKET_PORT = 8001
+    WS_PING_INTERVAL = 5  # Seconds between WebSocket pings
+    WS_PING_TIMEOUT = 3
+    WS_MAX_WRITE_BUFFER = 256 * 1024  # Drop clients that fall this far behind
+    WS_BATCH_WINDOW = 0.016  # Seconds to let a burst accumulate before sending it as one frame
+    WS_BATCH_MAX = 64  # Send at once, without waiting out the window, when this many are queued
+    # permessage-deflate: "deflate" when overlays are viewed over a real network; None keeps
+    # local clients from paying a per-connection recompress of every broadcast
+    WS_COMPRESSION = None
+    WS_SPLIT_PATH = "/splits"  # Split-times overlays connect here for binary frames instead of JSON
+    TCP_KEEPALIVE_IDLE = 5  # Seconds idle before the first TCP keepalive probe
+    TCP_KEEPALIVE_INTERVAL = 2
+    TCP_KEEPALIVE_COUNT = 3
+
+    # Binary split-times records, packed back to back (little-endian) in one frame per batch:
+    #   timer sync: u8 kind, u8 running
+    #   split:      u8 kind, u8 lane, u8 place (0 = none), u8 time number,
+    #               then u8-length time, u8-length display time, u16-length swimmer (UTF-8)
+    SPLIT_RECORD_TIMER = 1
+    SPLIT_RECORD_SPLIT = 2
+    _SPLIT_TIMER = struct.Struct('<BB')
+    _SPLIT_HEAD = struct.Struct('<BBBB')
+    _U16 = struct.Struct('<H')
+
+    # COM file transfer settings
+    COM_TRANSFER_TIMEOUT = 30.0  # Drop partial transfers with no chunk for this long
 
     # Timer sync settings
-    TIMER_SYNC_INTERVAL = 0.1  # Sync every 100ms for better accuracy
+    TIMER_SYNC_INTERVAL = 1.0  # Steady-state sync while clients extrapolate on their own
+    TIMER_SYNC_DRIFT = 0.15  # Sync early if the board drifts this far from the extrapolated time
     TIMER_LATENCY_COMPENSATION = 0.25  # Compensate for ~250ms lag
     DQ_STALE_TIMEOUT = 5.0 # Ignore DQ flags in first 5 seconds of a race
 
+    # Main loop housekeeping intervals (seconds)
+    LANE_CHECK_INTERVAL = 0.3
+    OBS_CHECK_INTERVAL = 0.1
+
+    # Lane finish time as read from the board, e.g. "01:02.34" -> (minutes, seconds, hundredths)
+    _TIME_RE = re.compile(r'^\s*(\d{0,2})\s*:\s*(\d{1,2})\s*\.\s*(\d{1,3})\s*$')
     
     def __init__(self, cts_port: str, receiver_port: str, baud: int = 9600, test_mode: bool = False):
         # Base directory setup
@@ -59,15 +161,48 @@ class SwimLiveSystem:
         self.baud = baud
         self.parity = serial.PARITY_EVEN
         
-        # Initialize display buffer
-        self.display = [[self.SPACE_ASCII] * self.CHARS_PER_CHANNEL for _ in range(self.CHANNELS)]
+        # Initialize display buffer: one byte per character, channel-major
+        self.display = bytearray([self.SPACE_ASCII]) * (self.CHANNELS * self.CHARS_PER_CHANNEL)
+        
+        # Character written for each data byte (low nibble holds the inverted digit).
+        # Every channel except the race clock shows a zero digit as blank.
+        self._digit_chars = bytes(((b & 0x0F) ^ 0x0F) + 48 for b in range(self.CONTROL_BYTE_THRESHOLD + 1))
+        self._digit_chars_blank_zero = bytes(
+            self.SPACE_ASCII if b & 0x0F == 0 else c for b, c in enumerate(self._digit_chars)
+        )
+        
+        # Decoded state for each control byte: (data_readout, channel, display offset, char table, clears channel)
+        self._control_actions: List[Optional[Tuple[bool, int, int, bytes, bool]]] = [None] * 256
+        for byte_in in range(self.CONTROL_BYTE_THRESHOLD + 1, 256):
+            channel = ((byte_in >> 1) & 0x1F) ^ 0x1F
+            self._control_actions[byte_in] = (
+                (byte_in & 1) == 0,
+                channel,
+                channel * self.CHARS_PER_CHANNEL,
+                self._digit_chars if channel == 0 else self._digit_chars_blank_zero,
+                channel < self.CHANNELS and byte_in > self.CLEAR_CHANNEL_THRESHOLD
+            )
         
         # Stream state
         self.stream_state = {"data_readout": False, "channel": 0}
         
+        # (channels, chars) NumPy view sharing memory with self.display for the vectorized decoders
+        self._display_arr = None
+        if np is not None:
+            self._display_arr = np.frombuffer(self.display, dtype=np.uint8).reshape(self.CHANNELS, self.CHARS_PER_CHANNEL)
+            if _parse_cts_chunk_jit is not None:
+                # Compile now rather than on the first serial read
+                _parse_cts_chunk_jit(np.zeros(0, dtype=np.uint8), self._display_arr, False, 0,
+                                     self.CONTROL_BYTE_THRESHOLD, self.CLEAR_CHANNEL_THRESHOLD, self.SPACE_ASCII)
+        
+        # Reusable CTS read buffer
+        self._cts_buf = bytearray(4096)
+        self._cts_view = memoryview(self._cts_buf)
+        
         # Caches
         self.event_cache: Dict[str, str] = {}
         self.swimmer_cache: Dict[str, List[List[str]]] = {}
+        self.heat_cache: Dict[str, Dict[int, Dict[str, Dict[str, str]]]] = {}  # event -> heat -> lanes
         
         # State tracking
         self.last_event = ""
@@ -75,31 +210,42 @@ class SwimLiveSystem:
         self.last_event_name = ""
         self.last_race_time = ""
         self.last_swimmers = {}
-        self.last_finish_times = {}
-        self.lane_time_counts = {str(i): 0 for i in range(1, 9)}  # Track how many times received per lane
+        self.last_finish_times = [""] * 9  # Last raw time per lane, indexed by lane number
+        self.lane_time_counts = [0] * 9  # Track how many times received per lane
         self.expected_times_per_lane = 1  # Default to 1 (finish only)
-        self.active_lanes = set()  # Set of active lane numbers
-        self.last_active_lanes = set()  # Previous state for change detection
-        self.last_lane_check_time = 0
+        self.active_lanes = 0  # Bitmask of active lanes (bit = 1 << lane)
+        self.last_active_lanes = 0  # Previous state for change detection
+        self._pending_active_lanes = -1  # Last unconfirmed reading for debouncing
         self.lane_check_interval = 0.5
         self._saved_sent_for_heat = False
-        self._dq_sent_for_heat = set() # ADD THIS LINE to track DQ lanes per heat
+        self._dq_sent_for_heat = 0  # Bitmask (1 << lane) of lanes whose DQ was sent this heat
+        self.lane_place_kind = [self.PLACE_EMPTY] * 9  # PLACE_* per lane, set by _get_lane_time
         
         # Timer state
         self.timer_running = False
-        self.timer_start_time = None
+        self.timer_start_time = None  # time.monotonic() when the race clock started
         self.timer_offset = 0.0
         self._last_sync_time = 0
+        self._last_sync_value = 0.0  # Race time sent with the last sync
         self._last_scene_check = 0
         
         # WebSocket components
-        self.websocket_clients = set()
-        self.data_queue = Queue()
+        self.websocket_clients = set()  # JSON clients
+        self.split_clients = set()  # Binary split-times clients (WS_SPLIT_PATH)
+        self.outbox: deque = deque()  # Pending updates; appended by producer threads, drained by the broadcaster
+        self._outbox_ready: Optional[asyncio.Event] = None  # Created on the server loop
+        self._wakeup_pending = False  # A broadcaster wakeup is already scheduled
+        self.loop: Optional[asyncio.AbstractEventLoop] = None  # Set once the WebSocket server starts
+        self._state_version = 0  # Bumped whenever the state sent to new clients changes
+        self._initial_state_cache: Optional[Tuple[int, bytes]] = None  # (version, encoded frame)
+        self._heat_results: List[Dict] = []  # Finish/DQ messages for the current heat, replayed on connect
+        self._heat_results_cache: Optional[Tuple[List[Dict], int, bytes]] = None  # (list, count, encoded frame)
         self.running = False
         
         # COM receiver state
         self.com_buffers = {}
-        self.com_line_buffer = ""
+        self.com_line_buffer = bytearray()
+        self._com_last_gc = 0.0
         
         # Setup serial connections
         self._setup_serial()
@@ -119,6 +265,10 @@ class SwimLiveSystem:
         except Exception as e:
             self.obs = None
             print(f"[OBS] Connection to OBS failed: {e}")
+        
+        # OBS requests run on their own thread so the main loop never waits on OBS
+        self.obs_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._obs_lock_pending = False  # A scene lock check is already queued
 
         
     def _setup_serial(self) -> None:
@@ -263,6 +413,8 @@ class SwimLiveSystem:
     let timerOffset = 0;
     let animationFrameId = null;
     let raceFinished = false; // Flag to prevent timer restart after first place finish
+    let pendingTimerSync = null; // Newest timerSync waiting for the next frame
+    let timerSyncScheduled = false;
 
     function formatTime(seconds) {
         if (seconds <= 0) return "00:00.0";
@@ -316,6 +468,22 @@ class SwimLiveSystem:
         }
     }
 
+    function flushTimerSync() {
+        timerSyncScheduled = false;
+        const timeData = pendingTimerSync;
+        pendingTimerSync = null;
+        if (timeData) syncTimer(timeData);
+    }
+
+    function queueTimerSync(timeData) {
+        // Only the newest sync matters - apply at most one per frame
+        pendingTimerSync = timeData;
+        if (!timerSyncScheduled) {
+            timerSyncScheduled = true;
+            requestAnimationFrame(flushTimerSync);
+        }
+    }
+
     function updateVisibility(running) {
         const boxes = [timerBox, eventBox, heatBox];
         if (running && !isVisible) {   
@@ -338,9 +506,8 @@ class SwimLiveSystem:
 
     function connectWebSocket() {
         ws = new WebSocket('ws://localhost:8001');
-        ws.onmessage = (message) => {
-            const data = JSON.parse(message.data);
-            if (data.timerSync !== undefined) syncTimer(data.timerSync);
+        const handleMessage = (data) => {
+            if (data.timerSync !== undefined) queueTimerSync(data.timerSync);
             if (data.eventName !== undefined) {
                 eventNameElement.textContent = data.eventName;
                 raceFinished = false; // Reset flag when new event starts
@@ -351,6 +518,13 @@ class SwimLiveSystem:
             }
             if (data.finishTime !== undefined) handleFinishTime(data.finishTime);
         };
+
+        ws.onmessage = (message) => {
+            const payload = JSON.parse(message.data);
+            // Bursts of updates arrive batched into a single array frame
+            if (Array.isArray(payload)) payload.forEach(handleMessage);
+            else handleMessage(payload);
+        };
         ws.onclose = () => setTimeout(connectWebSocket, 1000);
         ws.onerror = (error) => console.error('WebSocket error:', error);
     }
@@ -432,11 +606,24 @@ class SwimLiveSystem:
 			position: absolute; /* Changed to absolute to stack them and allow independent positioning */
 			opacity: 0;
 			transition: transform 0.3s ease;
+			/* Keep each cube on its own compositor layer so slider drags skip layout and paint */
+			will-change: transform;
 			/* Set common defaults */
 			top: 0;
 			left: 0;
         }
 
+		/* Per-lane cube transforms read custom properties set on the root element, so one batch of
+		   setProperty calls repositions every lane */
+		#cube1 { transform: translate3d(var(--l1-tx, 0px), var(--l1-ty, 0px), var(--l1-tz, 0px)) rotateX(var(--l1-rx, 0deg)) rotateY(var(--l1-ry, 0deg)) rotateZ(var(--l1-rz, 0deg)); }
+		#cube2 { transform: translate3d(var(--l2-tx, 0px), var(--l2-ty, 0px), var(--l2-tz, 0px)) rotateX(var(--l2-rx, 0deg)) rotateY(var(--l2-ry, 0deg)) rotateZ(var(--l2-rz, 0deg)); }
+		#cube3 { transform: translate3d(var(--l3-tx, 0px), var(--l3-ty, 0px), var(--l3-tz, 0px)) rotateX(var(--l3-rx, 0deg)) rotateY(var(--l3-ry, 0deg)) rotateZ(var(--l3-rz, 0deg)); }
+		#cube4 { transform: translate3d(var(--l4-tx, 0px), var(--l4-ty, 0px), var(--l4-tz, 0px)) rotateX(var(--l4-rx, 0deg)) rotateY(var(--l4-ry, 0deg)) rotateZ(var(--l4-rz, 0deg)); }
+		#cube5 { transform: translate3d(var(--l5-tx, 0px), var(--l5-ty, 0px), var(--l5-tz, 0px)) rotateX(var(--l5-rx, 0deg)) rotateY(var(--l5-ry, 0deg)) rotateZ(var(--l5-rz, 0deg)); }
+		#cube6 { transform: translate3d(var(--l6-tx, 0px), var(--l6-ty, 0px), var(--l6-tz, 0px)) rotateX(var(--l6-rx, 0deg)) rotateY(var(--l6-ry, 0deg)) rotateZ(var(--l6-rz, 0deg)); }
+		#cube7 { transform: translate3d(var(--l7-tx, 0px), var(--l7-ty, 0px), var(--l7-tz, 0px)) rotateX(var(--l7-rx, 0deg)) rotateY(var(--l7-ry, 0deg)) rotateZ(var(--l7-rz, 0deg)); }
+		#cube8 { transform: translate3d(var(--l8-tx, 0px), var(--l8-ty, 0px), var(--l8-tz, 0px)) rotateX(var(--l8-rx, 0deg)) rotateY(var(--l8-ry, 0deg)) rotateZ(var(--l8-rz, 0deg)); }
+
 		/* The actual lane container is the bottom face of the cube */
         .container {
             display: flex;
@@ -786,126 +973,129 @@ class SwimLiveSystem:
 		</div>
 	</div>
 
-	<div class="control-panel" id="controlPanel">
-		<h2>ðŸŽ² Cube Projection System</h2>
+	<!-- Control panel markup is only cloned into the page on first interaction -->
+	<template id="panelTpl">
+		<div class="control-panel" id="controlPanel">
+			<h2>ðŸŽ² Cube Projection System</h2>
 		
-		<div class="instructions">
-			<strong>Per-Lane Fine-Tuning:</strong>
-			Select an individual lane (L1-L8) to adjust its position and rotation. The **Translate Z** slider has a greatly increased range to handle severe perspective changes.
-		</div>
+			<div class="instructions">
+				<strong>Per-Lane Fine-Tuning:</strong>
+				Select an individual lane (L1-L8) to adjust its position and rotation. The **Translate Z** slider has a greatly increased range to handle severe perspective changes.
+			</div>
 
-		<div class="control-section">
-			<h3>Camera Perspective (Global)</h3>
+			<div class="control-section">
+				<h3>Camera Perspective (Global)</h3>
 			
-			<div class="control-group">
-				<label>
-					<span>Perspective Distance</span>
-					<span class="value-display" id="perspectiveValue">1500px</span>
-				</label>
-				<input type="range" id="perspective" min="500" max="3000" step="50" value="1500">
-			</div>
+				<div class="control-group">
+					<label>
+						<span>Perspective Distance</span>
+						<span class="value-display" id="perspectiveValue">1500px</span>
+					</label>
+					<input type="range" id="perspective" min="500" max="3000" step="50" value="1500">
+				</div>
 
-			<div class="control-group">
-				<label>
-					<span>View X Origin</span>
-					<span class="value-display" id="perspectiveXValue">50%</span>
-				</label>
-				<input type="range" id="perspectiveX" min="0" max="100" step="1" value="50">
-			</div>
+				<div class="control-group">
+					<label>
+						<span>View X Origin</span>
+						<span class="value-display" id="perspectiveXValue">50%</span>
+					</label>
+					<input type="range" id="perspectiveX" min="0" max="100" step="1" value="50">
+				</div>
 
-			<div class="control-group">
-				<label>
-					<span>View Y Origin</span>
-					<span class="value-display" id="perspectiveYValue">35%</span>
-				</label>
-				<input type="range" id="perspectiveY" min="0" max="100" step="1" value="35">
+				<div class="control-group">
+					<label>
+						<span>View Y Origin</span>
+						<span class="value-display" id="perspectiveYValue">35%</span>
+					</label>
+					<input type="range" id="perspectiveY" min="0" max="100" step="1" value="35">
+				</div>
 			</div>
-		</div>
 
-		<div class="control-section">
-			<h3>Select Lane to Adjust (Individual)</h3>
-			<div class="lane-select">
-				<button onclick="selectLane('all')" id="btnAll">ALL</button>
-				<button onclick="selectLane(1)" id="btn1">L1</button>
-				<button onclick="selectLane(2)" id="btn2">L2</button>
-				<button onclick="selectLane(3)" id="btn3">L3</button>
-				<button onclick="selectLane(4)" id="btn4" class="active">L4</button>
-				<button onclick="selectLane(5)" id="btn5">L5</button>
-				<button onclick="selectLane(6)" id="btn6">L6</button>
-				<button onclick="selectLane(7)" id="btn7">L7</button>
-				<button onclick="selectLane(8)" id="btn8">L8</button>
-			</div>
+			<div class="control-section">
+				<h3>Select Lane to Adjust (Individual)</h3>
+				<div class="lane-select">
+					<button onclick="selectLane('all')" id="btnAll">ALL</button>
+					<button onclick="selectLane(1)" id="btn1">L1</button>
+					<button onclick="selectLane(2)" id="btn2">L2</button>
+					<button onclick="selectLane(3)" id="btn3">L3</button>
+					<button onclick="selectLane(4)" id="btn4" class="active">L4</button>
+					<button onclick="selectLane(5)" id="btn5">L5</button>
+					<button onclick="selectLane(6)" id="btn6">L6</button>
+					<button onclick="selectLane(7)" id="btn7">L7</button>
+					<button onclick="selectLane(8)" id="btn8">L8</button>
+				</div>
 
-			<span class="all-lanes-label" id="controlLabel">Adjusting: LANE 4</span>
+				<span class="all-lanes-label" id="controlLabel">Adjusting: LANE 4</span>
 
-			<div class="control-group">
-				<label>
-					<span>Rotate X (Tilt)</span>
-					<span class="value-display" id="rotateXValue">68Â°</span>
-				</label>
-				<input type="range" id="rotateX" min="0" max="90" step="0.5" value="68">
-			</div>
+				<div class="control-group">
+					<label>
+						<span>Rotate X (Tilt)</span>
+						<span class="value-display" id="rotateXValue">68Â°</span>
+					</label>
+					<input type="range" id="rotateX" min="0" max="90" step="0.5" value="68">
+				</div>
 
-			<div class="control-group">
-				<label>
-					<span>Rotate Y (Turn/Skew)</span>
-					<span class="value-display" id="rotateYValue">0Â°</span>
-				</label>
-				<input type="range" id="rotateY" min="-45" max="45" step="0.5" value="0">
-			</div>
+				<div class="control-group">
+					<label>
+						<span>Rotate Y (Turn/Skew)</span>
+						<span class="value-display" id="rotateYValue">0Â°</span>
+					</label>
+					<input type="range" id="rotateY" min="-45" max="45" step="0.5" value="0">
+				</div>
 
-			<div class="control-group">
-				<label>
-					<span>Rotate Z (Roll)</span>
-					<span class="value-display" id="rotateZValue">0Â°</span>
-				</label>
-				<input type="range" id="rotateZ" min="-15" max="15" step="0.1" value="0">
-			</div>
+				<div class="control-group">
+					<label>
+						<span>Rotate Z (Roll)</span>
+						<span class="value-display" id="rotateZValue">0Â°</span>
+					</label>
+					<input type="range" id="rotateZ" min="-15" max="15" step="0.1" value="0">
+				</div>
 
-			<div class="control-group">
-				<label>
-					<span>Translate X (Left/Right)</span>
-					<span class="value-display" id="translateXValue">0px</span>
-				</label>
-				<input type="range" id="translateX" min="-1000" max="1000" step="5" value="0">
-			</div>
+				<div class="control-group">
+					<label>
+						<span>Translate X (Left/Right)</span>
+						<span class="value-display" id="translateXValue">0px</span>
+					</label>
+					<input type="range" id="translateX" min="-1000" max="1000" step="5" value="0">
+				</div>
 
-			<div class="control-group">
-				<label>
-					<span>Translate Y (Up/Down)</span>
-					<span class="value-display" id="translateYValue">0px</span>
-				</label>
-				<input type="range" id="translateY" min="-1000" max="1000" step="5" value="0">
-			</div>
+				<div class="control-group">
+					<label>
+						<span>Translate Y (Up/Down)</span>
+						<span class="value-display" id="translateYValue">0px</span>
+					</label>
+					<input type="range" id="translateY" min="-1000" max="1000" step="5" value="0">
+				</div>
 
-			<div class="control-group">
-				<label>
-					<span>Translate Z (Depth/Scale)</span>
-					<span class="value-display" id="translateZValue">0px</span>
-				</label>
-				<input type="range" id="translateZ" min="-2000" max="1000" step="10" value="0">
+				<div class="control-group">
+					<label>
+						<span>Translate Z (Depth/Scale)</span>
+						<span class="value-display" id="translateZValue">0px</span>
+					</label>
+					<input type="range" id="translateZ" min="-2000" max="1000" step="10" value="0">
+				</div>
 			</div>
-		</div>
 
-		<div class="control-section">
-			<h3>Quick Presets</h3>
-			<div class="preset-buttons">
-				<button onclick="applyPreset('calibrated')">Calibrated (Current Image)</button>
-				<button onclick="applyPreset('flat')">Flat View</button>
-				<button onclick="applyPreset('broadcast')">Broadcast</button>
-				<button onclick="applyPreset('olympic')">Olympic</button>
+			<div class="control-section">
+				<h3>Quick Presets</h3>
+				<div class="preset-buttons">
+					<button onclick="applyPreset('calibrated')">Calibrated (Current Image)</button>
+					<button onclick="applyPreset('flat')">Flat View</button>
+					<button onclick="applyPreset('broadcast')">Broadcast</button>
+					<button onclick="applyPreset('olympic')">Olympic</button>
+				</div>
 			</div>
-		</div>
 
-		<div class="button-group">
-			<button onclick="resetSelected()" class="secondary">Reset Selected</button>
-			<button onclick="copySettings()">Copy Values</button>
-		</div>
+			<div class="button-group">
+				<button onclick="resetSelected()" class="secondary">Reset Selected</button>
+				<button onclick="copySettings()">Copy Values</button>
+			</div>
 
-		<div style="margin-top: 12px; padding: 12px; background: rgba(0, 217, 255, 0.2); border-radius: 8px; text-align: center; color: #00D9FF; font-size: 12px;">
-			Each lane = bottom of cube â€¢ Rotate cube to project
+			<div style="margin-top: 12px; padding: 12px; background: rgba(0, 217, 255, 0.2); border-radius: 8px; text-align: center; color: #00D9FF; font-size: 12px;">
+				Each lane = bottom of cube â€¢ Rotate cube to project
+			</div>
 		</div>
-	</div>
+	</template>
 
 	<script>
 	// Club name scaling (KEEP)
@@ -924,6 +1114,9 @@ class SwimLiveSystem:
 		const targetWidth = measureElement.offsetWidth;
 		document.body.removeChild(measureElement);
 
+		// One context measures every club name
+		const context = document.createElement("canvas").getContext("2d");
+
 		clubElements.forEach(element => {
 			const textWidth = getTextWidth(element.textContent, getComputedStyle(element));
 			const scaleFactor = textWidth > targetWidth ? targetWidth / textWidth : 1;
@@ -931,8 +1124,6 @@ class SwimLiveSystem:
 		});
 
 		function getTextWidth(text, style) {
-			const canvas = document.createElement("canvas");
-			const context = canvas.getContext("2d");
 			context.font = `${style.fontWeight} ${style.fontSize} ${style.fontFamily}`;
 			return context.measureText(text).width;
 		}
@@ -958,39 +1149,42 @@ class SwimLiveSystem:
 			const parentWidth = element.parentElement.offsetWidth;
 			const maxWidth = parentWidth * maxWidthPercentage;
 
-			let fontSize = parseInt(window.getComputedStyle(element).fontSize, 10);
-
-			while (element.offsetWidth > maxWidth && fontSize > 1) {
-				fontSize -= 1;
-				element.style.fontSize = `${fontSize}px`;
+			// Text width scales with font size: measure once and write the fitted size once
+			const fontSize = parseInt(window.getComputedStyle(element).fontSize, 10);
+			const width = element.offsetWidth;
+			if (width > maxWidth) {
+				element.style.fontSize = `${Math.max(1, Math.floor(fontSize * maxWidth / width))}px`;
 			}
 		}
 	});
 	</script>
 	
 	<script>
+	// Lane cubes never change after load: cache them and their animated children once (index 0 = lane 1)
+	const LANE_CUBES = [];
+	const LANE_NUMBER_BOXES = [];
+	const SWIMMER_INFO_BOXES = [];
+
+	// Reveal order by lane number: centre lanes first (4/5), then outward in pairs
+	const LANE_GROUP = { 1: 3, 2: 2, 3: 1, 4: 0, 5: 0, 6: 1, 7: 2, 8: 3 };
+
 	// Animation timing (KEEP)
 	document.addEventListener("DOMContentLoaded", () => {
-		const laneGroups = [
-			[4, 5],
-			[3, 6],
-			[2, 7],
-			[1, 8]  
-		];
-		const findGroupIndex = (number) => {
-			return laneGroups.findIndex(group => group.includes(number));
-		};
-		const laneCubes = document.querySelectorAll(".lane-cube");
+		for (const cube of document.getElementsByClassName("lane-cube")) {
+			LANE_CUBES.push(cube);
+			LANE_NUMBER_BOXES.push(cube.querySelector(".LaneNumber"));
+			SWIMMER_INFO_BOXES.push(cube.querySelector(".SwimmerInfo"));
+		}
 
-		laneCubes.forEach(cube => {
-			const laneNumber = cube.querySelector(".LaneNumber");
-			const swimmerInfo = cube.querySelector(".SwimmerInfo");
+		LANE_CUBES.forEach((cube, i) => {
+			const laneNumber = LANE_NUMBER_BOXES[i];
+			const swimmerInfo = SWIMMER_INFO_BOXES[i];
 
 			setTimeout(() => {
 				cube.style.opacity = 1;
 			}, 100);
 
-			const groupIndex = findGroupIndex(parseInt(cube.querySelector(".LaneNumber .content").textContent.trim(), 10));
+			const groupIndex = LANE_GROUP[cube.dataset.lane | 0];
 			laneNumber.style.animationDelay = (groupIndex * 0.5).toString() + "s";
 			swimmerInfo.style.animationDelay = (groupIndex * 0.5 + 0.75).toString() + "s";
 		});
@@ -1034,43 +1228,158 @@ class SwimLiveSystem:
 		};
 		// --- End Calibration Data ---
 
+		// Every lane inherits from one shared defaults object (Object.create) and only holds its own
+		// copy of a field once it diverges; shadowed[prop] marks those lanes (bit lane - 1), so an
+		// ALL edit of a field no lane overrides is a single write to the shared object
+		function sharedSettings(perspective, perspectiveX, perspectiveY) {
+			const shared = { _version: 0, rotateX: 0, rotateY: 0, rotateZ: 0, translateX: 0, translateY: 0, translateZ: 0 };
+			const shadowed = { rotateX: 0, rotateY: 0, rotateZ: 0, translateX: 0, translateY: 0, translateZ: 0 };
+			const lanes = {};
+			for (let i = 1; i <= 8; i++) {
+				lanes[i] = Object.create(shared);
+			}
+			return { perspective, perspectiveX, perspectiveY, shared, shadowed, lanes };
+		}
+
+		// The settings shape is fixed, so copy fields directly rather than round-tripping through JSON
+		function cloneLane(L, shared) {
+			const lane = Object.create(shared);
+			lane.rotateX = L.rotateX;
+			lane.rotateY = L.rotateY;
+			lane.rotateZ = L.rotateZ;
+			lane.translateX = L.translateX;
+			lane.translateY = L.translateY;
+			lane.translateZ = L.translateZ;
+			return lane;
+		}
 
-		let cubeSettings = JSON.parse(JSON.stringify(CALIBRATED_SETTINGS)); // Start with calibrated
+		function cloneSettings(s) {
+			const settings = sharedSettings(s.perspective, s.perspectiveX, s.perspectiveY);
+			for (let i = 1; i <= 8; i++) {
+				settings.lanes[i] = cloneLane(s.lanes[i], settings.shared);
+			}
+			for (const prop in settings.shadowed) {
+				settings.shadowed[prop] = 0xFF;
+			}
+			return settings;
+		}
+
+		// Presets are built and frozen once at load; applying one copies numbers into fresh lanes
+		// instead of allocating and patching new lane literals on every click
+		function freezeSettings(s) {
+			for (let i = 1; i <= 8; i++) {
+				Object.freeze(s.lanes[i]);
+			}
+			Object.freeze(s.lanes);
+			return Object.freeze(s);
+		}
+
+		function derivePreset(perspective, perspectiveX, perspectiveY, laneFor) {
+			const lanes = {};
+			for (let i = 1; i <= 8; i++) {
+				lanes[i] = laneFor(i);
+			}
+			return freezeSettings({ perspective, perspectiveX, perspectiveY, lanes });
+		}
+
+		const PRESETS = Object.freeze({
+			calibrated: freezeSettings(CALIBRATED_SETTINGS),
+			broadcast: freezeSettings(BROADCAST_SETTINGS),
+			// Olympic Preset (similar to broadcast but slightly steeper)
+			olympic: derivePreset(1800, 50, 40, i => {
+				const L = BROADCAST_SETTINGS.lanes[i];
+				return { rotateX: 65, rotateY: L.rotateY, rotateZ: L.rotateZ, translateX: L.translateX, translateY: L.translateY, translateZ: L.translateZ - 50 };
+			}),
+			// Flat View - no perspective changes
+			flat: derivePreset(10000, 50, 50, i => ({
+				rotateX: 0,
+				rotateY: 0,
+				rotateZ: 0,
+				translateX: (i - 4.5) * 400, // Spread lanes horizontally
+				translateY: 0,
+				translateZ: 0
+			}))
+		});
+
+		let cubeSettings = cloneSettings(PRESETS.calibrated); // Start with calibrated
 		let selectedLane = 4; // Start with Lane 4 selected
 		let isInteracting = false;
 		let interactTimeout = null;
 
-		document.addEventListener("DOMContentLoaded", () => {
+		// DOM handles looked up once at startup (cubes/lanes/laneButtons index 0 = lane 1)
+		const TRANSFORM_PROPS = ['rotateX', 'rotateY', 'rotateZ', 'translateX', 'translateY', 'translateZ'];
+		const TRANSFORM_SET = new Set(TRANSFORM_PROPS);
+		const els = { cubes: [], lanes: [], laneButtons: [], sliders: {}, values: {}, btnAll: null, controlLabel: null, panel: null };
+
+		function cacheElements() {
+			for (let i = 1; i <= 8; i++) {
+				const container = document.getElementById('lane' + i);
+				els.cubes.push(LANE_CUBES[i - 1]);
+				els.lanes.push({
+					container: container,
+					name: container.querySelector(".name"),
+					club: container.querySelector(".club"),
+					laneNumber: LANE_NUMBER_BOXES[i - 1],
+					swimmerInfo: SWIMMER_INFO_BOXES[i - 1],
+					reveal: null
+				});
+			}
+		}
+
+		// Build the control panel from its template the first time it is needed, then wire it up.
+		// Displays that never see a pointer never parse, style or lay out the panel at all.
+		function ensurePanel() {
+			if (els.panel) return els.panel;
+			document.body.appendChild(document.getElementById('panelTpl').content.cloneNode(true));
+			for (let i = 1; i <= 8; i++) {
+				els.laneButtons.push(document.getElementById('btn' + i));
+			}
+			['perspective', 'perspectiveX', 'perspectiveY'].concat(TRANSFORM_PROPS).forEach(key => {
+				els.sliders[key] = document.getElementById(key);
+				els.values[key] = document.getElementById(key + 'Value');
+			});
+			els.btnAll = document.getElementById('btnAll');
+			els.controlLabel = document.getElementById('controlLabel');
+			els.panel = document.getElementById('controlPanel');
 			setupControls();
+			selectLane(selectedLane);
+			return els.panel;
+		}
+
+		document.addEventListener("DOMContentLoaded", () => {
+			cacheElements();
 			applyAllCubeTransforms();
 			detectInteractMode();
-			selectLane(4); // Start with Lane 4 selected for fine-tuning
 		});
 
 		function detectInteractMode() {
-			const panel = document.getElementById('controlPanel');
+			let lastMove = -Infinity;
 
-			document.addEventListener('mousemove', () => {
+			// Pointer motion is handled on the leading edge at most once per 150ms, so the panel
+			// still appears immediately; passive so the listener never holds up scrolling
+			document.addEventListener('mousemove', (e) => {
+				if (e.timeStamp - lastMove < 150) return;
+				lastMove = e.timeStamp;
 				if (!isInteracting) {
 					isInteracting = true;
-					panel.classList.add('visible');
+					ensurePanel().classList.add('visible');
 				}
-				
+
 				clearTimeout(interactTimeout);
 				interactTimeout = setTimeout(() => {
 					isInteracting = false;
-					panel.classList.remove('visible');
+					els.panel.classList.remove('visible');
 				}, 3000);
-			});
+			}, { passive: true });
 
 			document.addEventListener('click', () => {
 				isInteracting = true;
-				panel.classList.add('visible');
+				ensurePanel().classList.add('visible');
 				
 				clearTimeout(interactTimeout);
 				interactTimeout = setTimeout(() => {
 					isInteracting = false;
-					panel.classList.remove('visible');
+					els.panel.classList.remove('visible');
 				}, 5000);
 			});
 		}
@@ -1079,188 +1388,278 @@ class SwimLiveSystem:
 			selectedLane = lane;
 			
 			// Update button states
-			document.querySelectorAll('.lane-select button').forEach(btn => {
+			els.btnAll.classList.remove('active');
+			els.laneButtons.forEach(btn => {
 				btn.classList.remove('active');
 			});
 			if (lane === 'all') {
-				document.getElementById('btnAll').classList.add('active');
-				document.getElementById('controlLabel').textContent = 'Adjusting: ALL LANES (WARNING: Edits apply uniformly)';
+				els.btnAll.classList.add('active');
+				els.controlLabel.textContent = 'Adjusting: ALL LANES (WARNING: Edits apply uniformly)';
 			} else {
-				document.getElementById('btn' + lane).classList.add('active');
-				document.getElementById('controlLabel').textContent = 'Adjusting: LANE ' + lane;
+				els.laneButtons[lane - 1].classList.add('active');
+				els.controlLabel.textContent = 'Adjusting: LANE ' + lane;
 			}
 			
 			// Update sliders to show current values
 			updateSlidersForSelection();
 		}
 
-		function updateSlidersForSelection() {
+		// Read phase: gather everything the controls display from cubeSettings, touching no DOM
+		function readCurrentSettings(withTransforms) {
 			const referenceLane = (selectedLane === 'all' || selectedLane === null) ? 4 : selectedLane; // Use lane 4 as a central reference for ALL
-			
+			const current = {
+				perspective: cubeSettings.perspective,
+				perspectiveX: cubeSettings.perspectiveX,
+				perspectiveY: cubeSettings.perspectiveY,
+				lane: cubeSettings.lanes[referenceLane],
+				transforms: null
+			};
+			if (withTransforms) {
+				current.transforms = [];
+				for (let i = 1; i <= 8; i++) {
+					current.transforms.push(laneProperties(cubeSettings.lanes[i]));
+				}
+			}
+			return current;
+		}
+
+		// Write phase: one contiguous run of style/value writes so the browser recalculates once
+		function writeDomFromSettings(current) {
 			// Apply perspective settings globally
-			document.body.style.perspective = cubeSettings.perspective + 'px';
-			document.body.style.perspectiveOrigin = `${cubeSettings.perspectiveX}% ${cubeSettings.perspectiveY}%`;
+			document.body.style.perspective = current.perspective + 'px';
+			document.body.style.perspectiveOrigin = `${current.perspectiveX}% ${current.perspectiveY}%`;
 
 			// Update perspective controls directly from cubeSettings
-			document.getElementById('perspective').value = cubeSettings.perspective;
-			document.getElementById('perspectiveX').value = cubeSettings.perspectiveX;
-			document.getElementById('perspectiveY').value = cubeSettings.perspectiveY;
+			els.sliders.perspective.value = current.perspective;
+			els.sliders.perspectiveX.value = current.perspectiveX;
+			els.sliders.perspectiveY.value = current.perspectiveY;
 
 			// Update transform controls from selected/reference lane
-			const settings = cubeSettings.lanes[referenceLane];
-			document.getElementById('rotateX').value = settings.rotateX;
-			document.getElementById('rotateY').value = settings.rotateY;
-			document.getElementById('rotateZ').value = settings.rotateZ;
-			document.getElementById('translateX').value = settings.translateX;
-			document.getElementById('translateY').value = settings.translateY;
-			document.getElementById('translateZ').value = settings.translateZ;
-			
-			updateValueDisplays();
+			TRANSFORM_PROPS.forEach(prop => {
+				els.sliders[prop].value = current.lane[prop];
+			});
+
+			writeValueDisplays(current);
+
+			if (current.transforms) {
+				for (let i = 1; i <= 8; i++) {
+					writeLaneProperties(i, current.transforms[i - 1]);
+				}
+			}
+		}
+
+		function updateSlidersForSelection() {
+			writeDomFromSettings(readCurrentSettings(false));
 		}
 
 		function updateValueDisplays() {
-			document.getElementById('perspectiveValue').textContent = cubeSettings.perspective + 'px';
-			document.getElementById('perspectiveXValue').textContent = cubeSettings.perspectiveX + '%';
-			document.getElementById('perspectiveYValue').textContent = cubeSettings.perspectiveY + '%';
-			document.getElementById('rotateXValue').textContent = document.getElementById('rotateX').value + 'Â°';
-			document.getElementById('rotateYValue').textContent = document.getElementById('rotateY').value + 'Â°';
-			document.getElementById('rotateZValue').textContent = document.getElementById('rotateZ').value + 'Â°';
-			document.getElementById('translateXValue').textContent = document.getElementById('translateX').value + 'px';
-			document.getElementById('translateYValue').textContent = document.getElementById('translateY').value + 'px';
-			document.getElementById('translateZValue').textContent = document.getElementById('translateZ').value + 'px';
+			writeValueDisplays(readCurrentSettings(false));
 		}
 
-		function setupControls() {
-			// Perspective controls
-			document.getElementById('perspective').addEventListener('input', (e) => {
-				cubeSettings.perspective = parseFloat(e.target.value);
-				updateSlidersForSelection(); // Applies new global settings
-				applyAllCubeTransforms();
-			});
+		// Text last written to each value label; labels whose text is unchanged are not touched
+		const shownValues = {};
 
-			document.getElementById('perspectiveX').addEventListener('input', (e) => {
-				cubeSettings.perspectiveX = parseFloat(e.target.value);
-				updateSlidersForSelection(); 
-				applyAllCubeTransforms();
-			});
+		function setValueText(key, text) {
+			if (shownValues[key] === text) return;
+			shownValues[key] = text;
+			els.values[key].textContent = text;
+		}
 
-			document.getElementById('perspectiveY').addEventListener('input', (e) => {
-				cubeSettings.perspectiveY = parseFloat(e.target.value);
-				updateSlidersForSelection(); 
-				applyAllCubeTransforms();
+		function writeValueDisplays(current) {
+			const lane = current.lane;
+			setValueText('perspective', current.perspective + 'px');
+			setValueText('perspectiveX', current.perspectiveX + '%');
+			setValueText('perspectiveY', current.perspectiveY + '%');
+			setValueText('rotateX', lane.rotateX + 'Â°');
+			setValueText('rotateY', lane.rotateY + 'Â°');
+			setValueText('rotateZ', lane.rotateZ + 'Â°');
+			setValueText('translateX', lane.translateX + 'px');
+			setValueText('translateY', lane.translateY + 'px');
+			setValueText('translateZ', lane.translateZ + 'px');
+		}
+
+		// Slider input only records the new value; the DOM is flushed at most once per frame
+		let rafPending = false;
+		// Camera styles touched since the last flush; X and Y share the one perspectiveOrigin write
+		let pendingPerspective = false;
+		let pendingOrigin = false;
+		// Lanes whose transform changed since the last flush (bit lane - 1)
+		let dirtyLanes = 0;
+		const ALL_LANES_MASK = 0xFF;
+
+		function scheduleCubeFlush() {
+			if (rafPending) return;
+			rafPending = true;
+			requestAnimationFrame(() => {
+				rafPending = false;
+				const current = readCurrentSettings(false);
+				if (pendingPerspective) {
+					document.body.style.perspective = current.perspective + 'px';
+				}
+				if (pendingOrigin) {
+					document.body.style.perspectiveOrigin = current.perspectiveX + '% ' + current.perspectiveY + '%';
+				}
+				writeValueDisplays(current);
+				if (dirtyLanes === ALL_LANES_MASK) {
+					applyCubeTransforms('all');
+				} else {
+					for (let i = 1; i <= 8; i++) {
+						if (dirtyLanes & (1 << (i - 1))) applyCubeTransforms(i);
+					}
+				}
+				pendingPerspective = false;
+				pendingOrigin = false;
+				dirtyLanes = 0;
 			});
+		}
 
-			// Cube transform controls
-			const transformControls = ['rotateX', 'rotateY', 'rotateZ', 'translateX', 'translateY', 'translateZ'];
-			transformControls.forEach(control => {
-				document.getElementById(control).addEventListener('input', (e) => {
-					const value = parseFloat(e.target.value);
-					const prop = control;
+		function setupControls() {
+			// Every slider goes through one delegated listener on the panel, dispatched by slider id.
+			// They are all range inputs, so valueAsNumber hands back the number without a string parse.
+			els.panel.addEventListener('input', (e) => {
+				const prop = e.target.id;
+				if (prop === 'perspective') {
+					cubeSettings.perspective = e.target.valueAsNumber;
+					pendingPerspective = true;
+					scheduleCubeFlush();
+					return;
+				}
+				if (prop === 'perspectiveX' || prop === 'perspectiveY') {
+					cubeSettings[prop] = e.target.valueAsNumber;
+					pendingOrigin = true;
+					scheduleCubeFlush();
+					return;
+				}
+				if (!TRANSFORM_SET.has(prop)) return;
+				const value = e.target.valueAsNumber;
 
-					if (selectedLane === 'all') {
-						// Apply uniform change to all lanes
+				if (selectedLane === 'all') {
+					// Apply uniform change to all lanes: drop any per-lane overrides once, then write the shared default
+					const shadowed = cubeSettings.shadowed[prop];
+					if (shadowed) {
 						for (let i = 1; i <= 8; i++) {
-							cubeSettings.lanes[i][prop] = value;
+							if (shadowed & (1 << (i - 1))) delete cubeSettings.lanes[i][prop];
 						}
-					} else {
-						// Apply change only to the selected lane
-						cubeSettings.lanes[selectedLane][prop] = value;
+						cubeSettings.shadowed[prop] = 0;
 					}
-					applyAllCubeTransforms();
-					updateValueDisplays();
-				});
+					cubeSettings.shared[prop] = value;
+					cubeSettings.shared._version++;
+				} else {
+					// Apply change only to the selected lane, shadowing the shared default
+					cubeSettings.lanes[selectedLane][prop] = value;
+					cubeSettings.lanes[selectedLane]._dirty = true;
+					cubeSettings.shadowed[prop] |= 1 << (selectedLane - 1);
+				}
+				dirtyLanes |= selectedLane === 'all' ? ALL_LANES_MASK : 1 << (selectedLane - 1);
+				scheduleCubeFlush();
 			});
 
 			// Initialize displays
 			updateSlidersForSelection();
 		}
 
+		// Custom property names per lane, in the order laneProperties formats them (index 0 = lane 1)
+		const LANE_PROPERTY_KEYS = ['tx', 'ty', 'tz', 'rx', 'ry', 'rz'];
+		const LANE_PROPERTY_NAMES = [];
+		for (let i = 1; i <= 8; i++) {
+			LANE_PROPERTY_NAMES.push(LANE_PROPERTY_KEYS.map(key => `--l${i}-${key}`));
+		}
+
+		// The formatted values are cached on the lane and rebuilt only after a setter marks it _dirty
+		// or the shared defaults it inherits from move on to a new _version
+		// (lanes cloned in by a preset or reset carry no cache yet and are built on first use).
+		// A rebuild overwrites the lane's existing array in place, so slider drags allocate only the strings.
+		function laneProperties(settings) {
+			if (settings._dirty !== false || settings._builtVersion !== settings._version) {
+				const values = settings._transformCache || (settings._transformCache = new Array(6));
+				values[0] = settings.translateX + 'px';
+				values[1] = settings.translateY + 'px';
+				values[2] = settings.translateZ + 'px';
+				values[3] = settings.rotateX + 'deg';
+				values[4] = settings.rotateY + 'deg';
+				values[5] = settings.rotateZ + 'deg';
+				settings._dirty = false;
+				settings._builtVersion = settings._version;
+			}
+			return settings._transformCache;
+		}
+
+		// The cube is rotated and translated in 3D space
+		// The lane graphic (bottom face) appears projected onto the pool
+		function writeLaneProperties(lane, values) {
+			const rootStyle = document.documentElement.style;
+			const names = LANE_PROPERTY_NAMES[lane - 1];
+			for (let k = 0; k < 6; k++) {
+				rootStyle.setProperty(names[k], values[k]);
+			}
+		}
+
 		function applyAllCubeTransforms() {
-			// Apply transform to each cube
+			// Format every lane before touching the DOM, then write the properties back to back
+			const transforms = [];
 			for (let i = 1; i <= 8; i++) {
-				const cube = document.getElementById('cube' + i);
-				const settings = cubeSettings.lanes[i];
-				
-				// The cube is rotated and translated in 3D space
-				// The lane graphic (bottom face) appears projected onto the pool
-				cube.style.transform = `
-					translateX(${settings.translateX}px)
-					translateY(${settings.translateY}px)
-					translateZ(${settings.translateZ}px)
-					rotateX(${settings.rotateX}deg)
-					rotateY(${settings.rotateY}deg)
-					rotateZ(${settings.rotateZ}deg)
-				`;
+				transforms.push(laneProperties(cubeSettings.lanes[i]));
+			}
+			for (let i = 1; i <= 8; i++) {
+				writeLaneProperties(i, transforms[i - 1]);
 			}
 		}
 
-		function applyPreset(preset) {
-			let newSettings = {};
-			if (preset === 'calibrated') {
-				newSettings = JSON.parse(JSON.stringify(CALIBRATED_SETTINGS));
-			} else if (preset === 'broadcast') {
-				newSettings = JSON.parse(JSON.stringify(BROADCAST_SETTINGS));
-			} else if (preset === 'olympic') {
-				// Olympic Preset (similar to broadcast but slightly steeper)
-				newSettings = JSON.parse(JSON.stringify(BROADCAST_SETTINGS));
-				newSettings.perspective = 1800;
-				newSettings.perspectiveY = 40;
-				for (let i = 1; i <= 8; i++) {
-					newSettings.lanes[i].rotateX = 65;
-					newSettings.lanes[i].translateZ -= 50;
-				}
-			} else if (preset === 'flat') {
-				// Flat View - no perspective changes
-				newSettings.perspective = 10000;
-				newSettings.perspectiveX = 50;
-				newSettings.perspectiveY = 50;
-				for (let i = 1; i <= 8; i++) {
-					newSettings.lanes[i] = {
-						rotateX: 0,
-						rotateY: 0,
-						rotateZ: 0,
-						translateX: (i - 4.5) * 400, // Spread lanes horizontally
-						translateY: 0,
-						translateZ: 0
-					};
-				}
+		// Rewrite only the lane that changed; 'all' falls back to the full pass
+		function applyCubeTransforms(which) {
+			if (which === 'all') {
+				applyAllCubeTransforms();
+				return;
 			}
+			writeLaneProperties(which, laneProperties(cubeSettings.lanes[which]));
+		}
+
+		function applyPreset(preset) {
+			const template = PRESETS[preset];
+			if (!template) return;
 			
-			cubeSettings = newSettings;
+			cubeSettings = cloneSettings(template);
 			
-			// Update controls and apply transforms
-			updateSlidersForSelection();
-			applyAllCubeTransforms();
+			// Update controls and apply transforms in one read-then-write pass
+			writeDomFromSettings(readCurrentSettings(true));
 		}
 
 		function resetSelected() {
-			const resetSettings = CALIBRATED_SETTINGS.lanes;
+			const resetSettings = PRESETS.calibrated.lanes;
 			
 			if (selectedLane === 'all') {
 				// Reset all lanes to the Calibrated starting configuration
-				cubeSettings = JSON.parse(JSON.stringify(CALIBRATED_SETTINGS));
+				cubeSettings = cloneSettings(PRESETS.calibrated);
 			} else {
 				// Reset single lane to its Calibrated starting value
-				cubeSettings.lanes[selectedLane] = JSON.parse(JSON.stringify(resetSettings[selectedLane]));
+				cubeSettings.lanes[selectedLane] = cloneLane(resetSettings[selectedLane], cubeSettings.shared);
+				for (const prop of TRANSFORM_PROPS) {
+					cubeSettings.shadowed[prop] |= 1 << (selectedLane - 1);
+				}
 			}
 			
-			// Force update of global perspective settings on screen if needed
-			document.body.style.perspective = cubeSettings.perspective + 'px';
-			document.body.style.perspectiveOrigin = `${cubeSettings.perspectiveX}% ${cubeSettings.perspectiveY}%`;
-			
-			updateSlidersForSelection();
-			applyAllCubeTransforms();
+			// Perspective, controls and transforms in one read-then-write pass
+			writeDomFromSettings(readCurrentSettings(true));
 		}
 
 		function copySettings() {
-			let settingsText = `CAMERA PERSPECTIVE (body style):\nperspective: ${cubeSettings.perspective}px\nperspectiveX: ${cubeSettings.perspectiveX}%\nperspectiveY: ${cubeSettings.perspectiveY}%\n\nLANE CUBES (Independent Transforms):\n`;
+			const parts = [`CAMERA PERSPECTIVE (body style):\nperspective: ${cubeSettings.perspective}px\nperspectiveX: ${cubeSettings.perspectiveX}%\nperspectiveY: ${cubeSettings.perspectiveY}%\n\nLANE CUBES (Independent Transforms):\n`];
 			
 			for (let i = 1; i <= 8; i++) {
 				const s = cubeSettings.lanes[i];
-				settingsText += `Lane ${i}: rotateX=${s.rotateX}Â° rotateY=${s.rotateY}Â° rotateZ=${s.rotateZ}Â° translateX=${s.translateX}px translateY=${s.translateY}px translateZ=${s.translateZ}px\n`;
+				parts.push(
+					'Lane ', i,
+					': rotateX=', s.rotateX,
+					'Â° rotateY=', s.rotateY,
+					'Â° rotateZ=', s.rotateZ,
+					'Â° translateX=', s.translateX,
+					'px translateY=', s.translateY,
+					'px translateZ=', s.translateZ,
+					'px\\n'
+				);
 			}
 			
-			navigator.clipboard.writeText(settingsText).then(() => {
+			navigator.clipboard.writeText(parts.join('')).then(() => {
 				alert('Settings copied to clipboard!');
 			});
 		}
@@ -1271,18 +1670,21 @@ class SwimLiveSystem:
 		const wsUrl = "ws://localhost:8001";
 		let timerStartDetected = false;
 
+		// Messages are queued as they arrive and handled together once per animation frame
+		let pendingMessages = [];
+		let drainScheduled = false;
+
 		function connectWebSocket() {
 			const ws = new WebSocket(wsUrl);
 
-			ws.onmessage = (event) => {
-				const data = JSON.parse(event.data);
+			const handleMessage = (data, showLanes) => {
 
 				if (data.timerSync && data.timerSync.running && !timerStartDetected) {
 					timerStartDetected = true;
 					triggerFadeOut();
 				}
 
-				if (data.lanes) {
+				if (data.lanes && showLanes) {
                                     timerStartDetected = false;
                                     
                                     hideAllLanes();
@@ -1295,10 +1697,11 @@ class SwimLiveSystem:
                                         
                                         Object.keys(data.lanes).forEach(laneNum => {
                                             const lane = data.lanes[laneNum];
-                                            const container = document.getElementById(`lane${laneNum}`);
-                                            if (container) {
-                                                const nameEl = container.querySelector(".name");
-                                                const clubEl = container.querySelector(".club");
+                                            const laneEls = els.lanes[laneNum - 1];
+                                            if (laneEls) {
+                                                const container = laneEls.container;
+                                                const nameEl = laneEls.name;
+                                                const clubEl = laneEls.club;
 
                                                 nameEl.textContent = lane.name || "";
                                                 clubEl.textContent = lane.club || "";
@@ -1319,71 +1722,104 @@ class SwimLiveSystem:
 
                                 if (data.activeLanes !== undefined) {
                                     const activeLanes = data.activeLanes;
+                                    const toHide = [];
                                     
+                                    // Read phase: pick the visible lanes that were switched off
                                     for (let i = 1; i <= 8; i++) {
-                                        const container = document.getElementById(`lane${i}`);
-                                        if (container && container.parentElement.style.visibility === "visible") {
+                                        const cube = els.lanes[i - 1].container.parentElement;
+                                        if (cube.style.visibility === "visible") {
                                             const isLaneOff = activeLanes.length > 0 && !activeLanes.includes(i);
                                             if (isLaneOff) {
-                                                container.parentElement.classList.add("fade-out");
-                                                setTimeout(() => {
-                                                    container.parentElement.style.visibility = "hidden";
-                                                    container.parentElement.classList.remove("fade-out");
-                                                }, 1000);
+                                                toHide.push(cube);
                                             }
                                         }
                                     }
+
+                                    // Write phase: fade them together and hide them from one timer
+                                    if (toHide.length > 0) {
+                                        for (const cube of toHide) {
+                                            cube.classList.add("fade-out");
+                                        }
+                                        setTimeout(() => {
+                                            for (const cube of toHide) {
+                                                cube.style.visibility = "hidden";
+                                                cube.classList.remove("fade-out");
+                                            }
+                                        }, 1000);
+                                    }
                                 }
 			};
 
+			// Only the last lane list in a batch is shown, so earlier ones skip the hide/refresh cycle
+			const processBatch = (batch) => {
+				let lastLanes = -1;
+				for (let k = batch.length - 1; k >= 0; k--) {
+					if (batch[k].lanes) {
+						lastLanes = k;
+						break;
+					}
+				}
+				batch.forEach((data, k) => handleMessage(data, k === lastLanes));
+			};
+
+			ws.onmessage = (event) => {
+				const payload = JSON.parse(event.data);
+				if (Array.isArray(payload)) pendingMessages.push(...payload);
+				else pendingMessages.push(payload);
+				if (drainScheduled) return;
+				drainScheduled = true;
+				requestAnimationFrame(() => {
+					drainScheduled = false;
+					const batch = pendingMessages;
+					pendingMessages = [];
+					processBatch(batch);
+				});
+			};
+
 			ws.onclose = () => {
 				setTimeout(connectWebSocket, 1000);
 			};
 		}
 
 		function hideAllLanes() {
-			const laneCubes = document.querySelectorAll(".lane-cube");
-			laneCubes.forEach(cube => {
+			els.cubes.forEach((cube, i) => {
 				cube.style.opacity = "0";
 				cube.style.display = "none";
 				
-				const laneNumber = cube.querySelector(".LaneNumber");
-				const swimmerInfo = cube.querySelector(".SwimmerInfo");
-				laneNumber.style.animation = "none";
-				swimmerInfo.style.animation = "none";
+				const lane = els.lanes[i];
+				lane.laneNumber.style.animation = "none";
+				lane.swimmerInfo.style.animation = "none";
+				if (lane.reveal) {
+					lane.reveal.forEach(animation => animation.cancel());
+					lane.reveal = null;
+				}
 			});
 		}
 
+		// Reveal animations mirror the expandLaneNumber / fadeInFromLeft keyframes; built once and
+		// replayed through element.animate() so the animation shorthand is never reparsed
+		const LANE_NUMBER_KEYFRAMES = [
+			{ transform: "scale(0)", opacity: 0 },
+			{ transform: "scale(1)", opacity: 0.9 }
+		];
+		const SWIMMER_INFO_KEYFRAMES = [
+			{ opacity: 0, clipPath: "inset(0 100% 0 0)" },
+			{ opacity: 0.9, clipPath: "inset(0 0 0 0)" }
+		];
+
 		function refreshLanesWithAnimation() {
-			const laneGroups = [
-				[4, 5],
-				[3, 6],
-				[2, 7],
-				[1, 8]  
-			];
-			
-			const findGroupIndex = (number) => {
-				return laneGroups.findIndex(group => group.includes(number));
-			};
-			
-			const laneCubes = document.querySelectorAll(".lane-cube");
-			laneCubes.forEach(cube => {
-				const laneNumber = cube.querySelector(".LaneNumber");
-				const swimmerInfo = cube.querySelector(".SwimmerInfo");
-				
+			// element.animate() starts a fresh animation without a forced reflow between reset and replay
+			els.cubes.forEach((cube, i) => {
+				const lane = els.lanes[i];
 				cube.classList.remove("fade-out");
 				cube.style.display = "block";
 				
-				void cube.offsetWidth;
-				
-				const laneNum = parseInt(cube.querySelector(".LaneNumber .content").textContent.trim(), 10);
-				const groupIndex = findGroupIndex(laneNum);
-				
-				laneNumber.style.animation = "expandLaneNumber 1s ease forwards";
-				laneNumber.style.animationDelay = (groupIndex * 0.5).toString() + "s";
+				const groupIndex = LANE_GROUP[cube.dataset.lane | 0];
 				
-				swimmerInfo.style.animation = "fadeInFromLeft 1s ease forwards";
-				swimmerInfo.style.animationDelay = (groupIndex * 0.5 + 0.75).toString() + "s";
+				lane.reveal = [
+					lane.laneNumber.animate(LANE_NUMBER_KEYFRAMES, { duration: 1000, delay: groupIndex * 500, easing: "ease", fill: "forwards" }),
+					lane.swimmerInfo.animate(SWIMMER_INFO_KEYFRAMES, { duration: 1000, delay: groupIndex * 500 + 750, easing: "ease", fill: "forwards" })
+				];
 				
 				setTimeout(() => {
 					cube.style.opacity = 1;
@@ -1392,8 +1828,7 @@ class SwimLiveSystem:
 		}
 
 		function triggerFadeOut() {
-			const laneCubes = document.querySelectorAll(".lane-cube");
-			laneCubes.forEach(cube => {
+			els.cubes.forEach(cube => {
 				cube.classList.add("fade-out");
 				cube.addEventListener("animationend", () => {
 					cube.style.display = "none";
@@ -1501,16 +1936,18 @@ class SwimLiveSystem:
 		@keyframes zoomInFromRight {
 			0% {
 				opacity: 0;
-				transform: translateX(250px);
+				transform: translate3d(250px, 0, 0);
 			}
 			100% {
 				opacity: 0.975;
-				transform: translateX(0);
+				transform: translate3d(0, 0, 0);
 			}
 		}
 
+		/* Rows are promoted up front so the slide-in runs on the compositor from its first frame */
 		.row {
-			transform: translateX(0);
+			transform: translate3d(0, 0, 0);
+			will-change: transform, opacity;
 		}
 
 		.row.zoom-in {
@@ -1518,83 +1955,54 @@ class SwimLiveSystem:
 		}
 
     </style>
-    <script>
-		document.addEventListener("DOMContentLoaded", () => {
-			const rows = document.querySelectorAll(".row");
-
-			rows.forEach(row => {
-				const splitTime = row.querySelector(".splitTime").textContent.trim();
-				if (!splitTime) {
-					row.style.visibility = 'hidden'; // Hide instead of remove
-				}
-			});
-		});
-	</script>
-	<script>
-	document.addEventListener("DOMContentLoaded", () => {
-		const nameElements = document.querySelectorAll(".name");
-
-		nameElements.forEach(nameElement => {
-			adjustFontSize(nameElement, 0.60);
-		});
-
-		function adjustFontSize(element, maxWidthPercentage) {
-			const parentWidth = element.parentElement.offsetWidth;
-			const maxWidth = parentWidth * maxWidthPercentage;
-
-			let fontSize = parseInt(window.getComputedStyle(element).fontSize, 10);
-
-			while (element.offsetWidth > maxWidth && fontSize > 1) {
-				fontSize -= 1;
-				element.style.fontSize = `${fontSize}px`;
-			}
-		}
-	});
-	</script>
-	<!-- 1. Font size adjustment function -->
+<!-- 1. Font size adjustment function -->
 <script>
-document.addEventListener("DOMContentLoaded", () => {
-    const nameElements = document.querySelectorAll(".name");
-
-    nameElements.forEach(nameElement => {
-        adjustFontSize(nameElement, 0.60);
-    });
-});
-
 function adjustFontSize(element, maxWidthPercentage) {
     const parentWidth = element.parentElement.offsetWidth;
     const maxWidth = parentWidth * maxWidthPercentage;
 
-    let fontSize = parseInt(window.getComputedStyle(element).fontSize, 10);
-
-    while (element.offsetWidth > maxWidth && fontSize > 1) {
-        fontSize -= 1;
-        element.style.fontSize = `${fontSize}px`;
+    const fontSize = parseInt(window.getComputedStyle(element).fontSize, 10);
+    const width = element.offsetWidth;
+    if (width > maxWidth) {
+        element.style.fontSize = `${Math.max(1, Math.floor(fontSize * maxWidth / width))}px`;
     }
 }
 </script>
 
-<!-- 2. Hide empty rows on load -->
+<!-- 2. Hide empty rows and fit names on load, in one pass over the rows -->
 <script>
+// The split container and its rows never change; looked up once on load.
+// rowIndex maps row id (the place) to the row and its text nodes.
+let containerEl;
+const rowIndex = new Map();
+
 document.addEventListener("DOMContentLoaded", () => {
-    const rows = document.querySelectorAll(".row");
+    containerEl = document.querySelector('.container');
+    const rows = document.getElementsByClassName("row");
+
+    for (const row of rows) {
+        rowIndex.set(row.id, {
+            row: row,
+            lane: row.querySelector('.LaneNumber .content'),
+            name: row.querySelector('.SwimmerInfo .name'),
+            split: row.querySelector('.SwimmerInfo .splitTime')
+        });
 
-    rows.forEach(row => {
         const splitTime = row.querySelector(".splitTime").textContent.trim();
         if (!splitTime) {
-            row.style.visibility = 'hidden';
+            row.style.visibility = 'hidden'; // Hide instead of remove
         }
-    });
+
+        const nameElement = row.querySelector(".name");
+        if (nameElement) {
+            adjustFontSize(nameElement, 0.60);
+        }
+    }
 });
 </script>
 
 <!-- 3. All helper functions BEFORE WebSocket -->
 <script>
-// Format time function
-function formatTime(time) {
-    return time.replace(/^0+:?0*/, '') || '0.00';
-}
-
 // Update split time display
 function updateSplitTime(data) {
     const place = data.finishTime.place;
@@ -1605,7 +2013,7 @@ function updateSplitTime(data) {
     
     
     // Show the container when we have splits to display
-    const container = document.querySelector('.container');
+    const container = containerEl;
     container.style.visibility = 'visible';
     container.style.opacity = '0.975';
     container.classList.remove('fade-out');
@@ -1622,37 +2030,38 @@ function updateSplitTime(data) {
     }
     
     // Find the row by place (id)
-    const row = document.getElementById(place);
+    const entry = rowIndex.get(String(place));
     
-    if (row) {
+    if (entry) {
+        const row = entry.row;
         
 		// Set initial transform state BEFORE making visible
         row.style.opacity = '0';
-        row.style.transform = 'translateX(250px)';
+        row.style.transform = 'translate3d(250px, 0, 0)';
         row.classList.remove('zoom-in');
         
         // Update content first
-        const laneNumberContent = row.querySelector('.LaneNumber .content');
+        const laneNumberContent = entry.lane;
         if (laneNumberContent) {
             laneNumberContent.textContent = lane;
         }
         
-        const nameElement = row.querySelector('.SwimmerInfo .name');
+        const nameElement = entry.name;
         if (nameElement) {
             nameElement.textContent = formattedName;
             adjustFontSize(nameElement, 0.60);
         }
         
-        const splitTimeElement = row.querySelector('.SwimmerInfo .splitTime');
+        const splitTimeElement = entry.split;
         if (splitTimeElement) {
             let displayTime;
             
             if (parseInt(place) === 1) {
-                displayTime = formatTime(time);
+                displayTime = data.finishTime.displayTime;
             } else if (leaderState.leaderTime) {
                 displayTime = calculateTimeDifference(time, leaderState.leaderTime);
             } else {
-                displayTime = formatTime(time);
+                displayTime = data.finishTime.displayTime;
             }
             
             splitTimeElement.textContent = displayTime;
@@ -1685,22 +2094,19 @@ let leaderState = {
 	leaderTime: null
 };
 
+// Convert times from MM:SS.ss or SS.ss format to total seconds in one pass (no split array)
+function timeToSeconds(time) {
+    const colon = time.indexOf(':');
+    if (colon < 0) {
+        // Format: SS.ss
+        return parseFloat(time);
+    }
+    // Format: MM:SS.ss
+    return parseInt(time.slice(0, colon), 10) * 60 + parseFloat(time.slice(colon + 1));
+}
+
 // Calculate time difference from leader
 function calculateTimeDifference(swimmerTime, leaderTime) {
-    // Convert times from MM:SS.ss or SS.ss format to total seconds
-    function timeToSeconds(time) {
-        const parts = time.split(':');
-        if (parts.length === 2) {
-            // Format: MM:SS.ss
-            const minutes = parseInt(parts[0]);
-            const seconds = parseFloat(parts[1]);
-            return minutes * 60 + seconds;
-        } else {
-            // Format: SS.ss
-            return parseFloat(time);
-        }
-    }
-    
     const swimmerSeconds = timeToSeconds(swimmerTime);
     const leaderSeconds = timeToSeconds(leaderTime);
     const difference = swimmerSeconds - leaderSeconds;
@@ -1756,11 +2162,33 @@ function shouldShowSplitTime(data) {
     return true;
 }
 
+// Blank and hide every row; the container is taken out of layout meanwhile, so the writes cost one reflow
+function clearRows(container) {
+    container.style.display = 'none';
+    rowIndex.forEach(entry => {
+        if (entry.lane) {
+            entry.lane.textContent = '';
+        }
+        
+        if (entry.name) {
+            entry.name.textContent = '';
+        }
+        
+        if (entry.split) {
+            entry.split.textContent = '';
+        }
+        
+        entry.row.style.visibility = 'hidden';
+        entry.row.classList.remove('zoom-in');
+    });
+    container.style.display = '';
+}
+
 // Soft reset - clear display but keep tracking
 function softResetRows() {
     
     
-    const container = document.querySelector('.container');
+    const container = containerEl;
    
     
     // Add fade out animation
@@ -1773,27 +2201,7 @@ function softResetRows() {
         container.style.opacity = '0';
         container.classList.remove('fade-out');
         
-        const rows = document.querySelectorAll('.row');
-        
-        rows.forEach(row => {
-            const laneNumberContent = row.querySelector('.LaneNumber .content');
-            if (laneNumberContent) {
-                laneNumberContent.textContent = '';
-            }
-            
-            const nameElement = row.querySelector('.SwimmerInfo .name');
-            if (nameElement) {
-                nameElement.textContent = '';
-            }
-            
-            const splitTimeElement = row.querySelector('.SwimmerInfo .splitTime');
-            if (splitTimeElement) {
-                splitTimeElement.textContent = '';
-            }
-            
-            row.style.visibility = 'hidden';
-            row.classList.remove('zoom-in');
-        });
+        clearRows(container);
     }, 500);
 }
 
@@ -1812,7 +2220,7 @@ function resetAllRows() {
         softResetTimeout: null,
 		leaderTime: null
     };
-    const container = document.querySelector('.container');
+    const container = containerEl;
     
     // Add fade out animation
     container.classList.add('fade-out');
@@ -1822,27 +2230,7 @@ function resetAllRows() {
         container.style.visibility = 'hidden';
         container.classList.remove('fade-out');
         
-        const rows = document.querySelectorAll('.row');
-        
-        rows.forEach(row => {
-            const laneNumberContent = row.querySelector('.LaneNumber .content');
-            if (laneNumberContent) {
-                laneNumberContent.textContent = '';
-            }
-            
-            const nameElement = row.querySelector('.SwimmerInfo .name');
-            if (nameElement) {
-                nameElement.textContent = '';
-            }
-            
-            const splitTimeElement = row.querySelector('.SwimmerInfo .splitTime');
-            if (splitTimeElement) {
-                splitTimeElement.textContent = '';
-            }
-            
-            row.style.visibility = 'hidden';
-            row.classList.remove('zoom-in');
-        });
+        clearRows(container);
     }, 500);
 }
 
@@ -1852,7 +2240,7 @@ let timerWasRunning = false;
 // Handle timer sync messages
 function handleTimerSync(data) {
     const isRunning = data.timerSync.running;
-    const container = document.querySelector('.container');
+    const container = containerEl;
     
     if (!isRunning && timerWasRunning) {
         container.style.visibility = 'hidden';
@@ -1866,18 +2254,90 @@ function handleTimerSync(data) {
 
 <!-- 4. WebSocket connection LAST -->
 <script>
-const wsUrl = "ws://localhost:8001";
+const wsUrl = "ws://localhost:8001/splits";
 let ws;
 
+// The /splits endpoint sends binary records (layout in SwimLiveSystem._encode_split_frame)
+const SPLIT_RECORD_TIMER = 1;
+const SPLIT_RECORD_SPLIT = 2;
+const splitTextDecoder = new TextDecoder();
+
+// Decode every record in a binary frame into the same shape as the JSON messages
+function decodeSplitFrame(buffer, out) {
+    const bytes = new Uint8Array(buffer);
+    const view = new DataView(buffer);
+    let offset = 0;
+    while (offset < bytes.length) {
+        const kind = bytes[offset];
+        if (kind === SPLIT_RECORD_TIMER) {
+            out.push({ timerSync: { running: bytes[offset + 1] === 1 } });
+            offset += 2;
+        } else if (kind === SPLIT_RECORD_SPLIT) {
+            const lane = bytes[offset + 1];
+            const place = bytes[offset + 2];
+            const timeNumber = bytes[offset + 3];
+            offset += 4;
+            let length = bytes[offset++];
+            const time = splitTextDecoder.decode(bytes.subarray(offset, offset + length));
+            offset += length;
+            length = bytes[offset++];
+            const displayTime = splitTextDecoder.decode(bytes.subarray(offset, offset + length));
+            offset += length;
+            length = view.getUint16(offset, true);
+            offset += 2;
+            const swimmer = splitTextDecoder.decode(bytes.subarray(offset, offset + length));
+            offset += length;
+            out.push({ finishTime: { lane, place: place ? String(place) : '', swimmer, time, displayTime, type: 'SPLIT', timeNumber } });
+        } else {
+            return; // Unknown record kind: the rest of the frame cannot be walked
+        }
+    }
+}
+
+let pendingMessages = [];
+let drainScheduled = false;
+
+// Frames this page cares about: a SPLIT finish or a timer sync (compiled once, one pass per frame)
+const RELEVANT_FRAME = /"type"\\s*:\\s*"SPLIT"|"timerSync"\\s*:/;
+
+// While the page is hidden animation frames are paused, so nothing is queued: splits are stale
+// by the time it is shown again and are dropped, and only the newest timer state is kept
+let hiddenTimerSync = null;
+
+function rememberTimerSync(raw) {
+    const messages = [];
+    if (typeof raw === 'string') {
+        if (raw.indexOf('"timerSync"') === -1) return;
+        const payload = JSON.parse(raw);
+        if (Array.isArray(payload)) messages.push(...payload);
+        else messages.push(payload);
+    } else {
+        decodeSplitFrame(raw, messages);
+    }
+    for (let i = messages.length - 1; i >= 0; i--) {
+        if (messages[i].timerSync) {
+            hiddenTimerSync = messages[i];
+            return;
+        }
+    }
+}
+
+document.addEventListener('visibilitychange', () => {
+    if (document.hidden || !hiddenTimerSync) return;
+    // Apply the clock state missed while hidden, so a heat that ended clears its rows
+    handleTimerSync(hiddenTimerSync);
+    hiddenTimerSync = null;
+});
+
 function connectWebSocket() {
     ws = new WebSocket(wsUrl);
+    ws.binaryType = 'arraybuffer';
 
     ws.onopen = () => {
         console.log('[WS] Connected to Swim Live System');
     };
 
-    ws.onmessage = (event) => {
-        const data = JSON.parse(event.data);
+    const handleMessage = (data) => {
 
         // Handle timer sync
         if (data.timerSync) {
@@ -1893,6 +2353,32 @@ function connectWebSocket() {
         }
     };
 
+    ws.onmessage = (event) => {
+        const raw = event.data;
+        if (document.hidden) {
+            rememberTimerSync(raw);
+            return;
+        }
+        if (typeof raw === 'string') {
+            // JSON fallback: this page only reacts to timer syncs and SPLIT finishes; skip parsing frames that carry neither
+            if (!RELEVANT_FRAME.test(raw)) return;
+            const payload = JSON.parse(raw);
+            if (Array.isArray(payload)) pendingMessages.push(...payload);
+            else pendingMessages.push(payload);
+        } else {
+            decodeSplitFrame(raw, pendingMessages);
+            if (!pendingMessages.length) return;
+        }
+        if (drainScheduled) return;
+        drainScheduled = true;
+        requestAnimationFrame(() => {
+            drainScheduled = false;
+            const batch = pendingMessages;
+            pendingMessages = [];
+            batch.forEach(handleMessage);
+        });
+    };
+
     ws.onclose = () => {
         console.log('[WS] Connection closed. Reconnecting...');
         setTimeout(connectWebSocket, 1000);
@@ -1923,76 +2409,20 @@ window.addEventListener('beforeunload', () => {
                 <div class="splitTime"></div>
             </div>
         </div>
-        <!-- Row 2 -->
-        <div class="row" id ="2">
-            <div class="box LaneNumber">
-                <div class="content"></div>
-            </div>
-            <div class="box SwimmerInfo">
-                <div class="name"></div>
-                <div class="splitTime"></div>
-            </div>
-        </div>
-        <!-- Row 3 -->
-        <div class="row" id ="3">
-            <div class="box LaneNumber">
-                <div class="content"></div>
-            </div>
-            <div class="box SwimmerInfo">
-                <div class="name"></div>
-                <div class="splitTime"></div>
-            </div>
-        </div>
-        <!-- Row 4 -->
-        <div class="row" id ="4">
-            <div class="box LaneNumber">
-                <div class="content"></div>
-            </div>
-            <div class="box SwimmerInfo">
-                <div class="name"></div>
-                <div class="splitTime"></div>
-            </div>
-        </div>
-		<!-- Row 5 -->
-        <div class="row" id ="5">
-            <div class="box LaneNumber">
-                <div class="content"></div>
-            </div>
-            <div class="box SwimmerInfo">
-                <div class="name"></div>
-                <div class="splitTime"></div>
-            </div>
-        </div>
-		<!-- Row 6 -->
-        <div class="row" id ="6">
-            <div class="box LaneNumber">
-                <div class="content"></div>
-            </div>
-            <div class="box SwimmerInfo">
-                <div class="name"></div>
-                <div class="splitTime"></div>
-            </div>
-        </div>
-		<!-- Row 7 -->
-        <div class="row" id ="7">
-            <div class="box LaneNumber">
-                <div class="content"></div>
-            </div>
-            <div class="box SwimmerInfo">
-                <div class="name"></div>
-                <div class="splitTime"></div>
-            </div>
-        </div>
-		<!-- Row 8 -->
-        <div class="row" id ="8">
-            <div class="box LaneNumber">
-                <div class="content"></div>
-            </div>
-            <div class="box SwimmerInfo">
-                <div class="name"></div>
-                <div class="splitTime"></div>
-            </div>
-        </div>
+        <script>
+            // The eight rows share one skeleton: clone row 1 for places 2-8 during parsing
+            (function() {
+                const first = document.getElementById('1');
+                let previous = first;
+                for (let i = 2; i <= 8; i++) {
+                    const clone = first.cloneNode(true);
+                    clone.id = String(i);
+                    // Insert directly after the previous row so sibling selectors still see adjacent rows
+                    previous.after(clone);
+                    previous = clone;
+                }
+            })();
+        </script>
     </div>
 </body>
 </html>'''
@@ -2061,6 +2491,10 @@ window.addEventListener('beforeunload', () => {
             opacity: 0;
             visibility: hidden;
             transform-style: preserve-3d;
+            /* Keep each lane on its own compositor layer so slider drags skip layout and paint */
+            will-change: transform;
+            /* Set on #laneWrapper for all lanes at once, or on a container to override one lane */
+            transform: translate3d(var(--tx, 0px), var(--ty, 0px), var(--tz, 0px)) rotateX(var(--rx, 0deg)) rotateY(var(--ry, 0deg)) rotateZ(var(--rz, 0deg));
         }
 
         .box {
@@ -2077,7 +2511,6 @@ window.addEventListener('beforeunload', () => {
             display: flex;
             align-items: center;
             justify-content: flex-start;
-            animation: fadeInFromLeft 1s ease forwards;
             opacity: 0;
         }
 
@@ -2095,8 +2528,6 @@ window.addEventListener('beforeunload', () => {
             display: flex;
             justify-content: flex-end;
             align-items: center;
-            animation: fadeInFromLeft 1s ease forwards;
-            animation-delay: 0.5s;
             opacity: 0;
             width: 200px;
         }
@@ -2115,8 +2546,6 @@ window.addEventListener('beforeunload', () => {
             width: 88px;
             justify-content: center;
             transform-origin: center;
-            animation: expandPosition 1s ease forwards;
-            animation-delay: 1s;
             opacity: 0;
         }
 
@@ -2127,6 +2556,19 @@ window.addEventListener('beforeunload', () => {
             opacity: 0.95;
         }
 
+        /* Finish reveal - one class flip restarts all three animations */
+        .container.finish > .SwimmerInfo {
+            animation: fadeInFromLeft 1s ease forwards;
+        }
+
+        .container.finish > .SwimmerTime {
+            animation: fadeInFromLeft 1s 0.5s ease forwards;
+        }
+
+        .container.finish > .LaneNumber {
+            animation: expandPosition 1s 1s ease forwards;
+        }
+
         .fade-out {
             animation: fadeOut 1s ease forwards;
         }
@@ -2332,260 +2774,249 @@ window.addEventListener('beforeunload', () => {
             <div class="position"></div>
         </div>
     </div>
-    <div class="container" id="2">
-        <div class="box SwimmerInfo">
-            <div class="name"></div>
-        </div>
-        <div class="box SwimmerTime">
-            <div class="time"></div>
-        </div>
-        <div class="box LaneNumber">
-            <div class="position"></div>
-        </div>
-    </div>
-    <div class="container" id="3">
-        <div class="box SwimmerInfo">
-            <div class="name"></div>
-        </div>
-        <div class="box SwimmerTime">
-            <div class="time"></div>
-        </div>
-        <div class="box LaneNumber">
-            <div class="position"></div>
-        </div>
-    </div>
-    <div class="container" id="4">
-        <div class="box SwimmerInfo">
-            <div class="name"></div>
-        </div>
-        <div class="box SwimmerTime">
-            <div class="time"></div>
-        </div>
-        <div class="box LaneNumber">
-            <div class="position"></div>
-        </div>
-    </div>
-    <div class="container" id="5">
-        <div class="box SwimmerInfo">
-            <div class="name"></div>
-        </div>
-        <div class="box SwimmerTime">
-            <div class="time"></div>
-        </div>
-        <div class="box LaneNumber">
-            <div class="position"></div>
-        </div>
-    </div>
-    <div class="container" id="6">
-        <div class="box SwimmerInfo">
-            <div class="name"></div>
-        </div>
-        <div class="box SwimmerTime">
-            <div class="time"></div>
-        </div>
-        <div class="box LaneNumber">
-            <div class="position"></div>
-        </div>
-    </div>
-    <div class="container" id="7">
-        <div class="box SwimmerInfo">
-            <div class="name"></div>
-        </div>
-        <div class="box SwimmerTime">
-            <div class="time"></div>
-        </div>
-        <div class="box LaneNumber">
-            <div class="position"></div>
-        </div>
-    </div>
-    <div class="container" id="8">
-        <div class="box SwimmerInfo">
-            <div class="name"></div>
-        </div>
-        <div class="box SwimmerTime">
-            <div class="time"></div>
-        </div>
-        <div class="box LaneNumber">
-            <div class="position"></div>
-        </div>
-    </div>
+    <script>
+        // The eight result rows share one skeleton: clone lane 1 for lanes 2-8 before anything looks them up
+        (function() {
+            const first = document.getElementById('1');
+            let previous = first;
+            for (let i = 2; i <= 8; i++) {
+                const clone = first.cloneNode(true);
+                clone.id = String(i);
+                previous.after(clone);
+                previous = clone;
+            }
+        })();
+    </script>
     </div>
 
-    <div class="control-panel" id="controlPanel">
-        <h2>ðŸŽ¯ Lane Ends Projection</h2>
+    <!-- Control panel markup is only cloned into the page on first interaction -->
+    <template id="panelTpl">
+        <div class="control-panel" id="controlPanel">
+            <h2>ðŸŽ¯ Lane Ends Projection</h2>
         
-        <div class="instructions">
-            <strong>Cube Projection System:</strong>
-            Each finish result is the bottom face of an imaginary cube. Rotate the cube in 3D space to project the graphic onto the pool surface from your camera's viewpoint!
-        </div>
+            <div class="instructions">
+                <strong>Cube Projection System:</strong>
+                Each finish result is the bottom face of an imaginary cube. Rotate the cube in 3D space to project the graphic onto the pool surface from your camera's viewpoint!
+            </div>
 
-        <div class="control-section">
-            <h3>Camera Perspective</h3>
+            <div class="control-section">
+                <h3>Camera Perspective</h3>
             
-            <div class="control-group">
-                <label>
-                    <span>Perspective Distance</span>
-                    <span class="value-display" id="perspectiveValue">1500px</span>
-                </label>
-                <input type="range" id="perspective" min="500" max="3000" step="50" value="1500">
-            </div>
+                <div class="control-group">
+                    <label>
+                        <span>Perspective Distance</span>
+                        <span class="value-display" id="perspectiveValue">1500px</span>
+                    </label>
+                    <input type="range" id="perspective" min="500" max="3000" step="50" value="1500">
+                </div>
 
-            <div class="control-group">
-                <label>
-                    <span>View X Origin</span>
-                    <span class="value-display" id="perspectiveXValue">50%</span>
-                </label>
-                <input type="range" id="perspectiveX" min="0" max="100" step="1" value="50">
-            </div>
+                <div class="control-group">
+                    <label>
+                        <span>View X Origin</span>
+                        <span class="value-display" id="perspectiveXValue">50%</span>
+                    </label>
+                    <input type="range" id="perspectiveX" min="0" max="100" step="1" value="50">
+                </div>
 
-            <div class="control-group">
-                <label>
-                    <span>View Y Origin</span>
-                    <span class="value-display" id="perspectiveYValue">50%</span>
-                </label>
-                <input type="range" id="perspectiveY" min="0" max="100" step="1" value="50">
+                <div class="control-group">
+                    <label>
+                        <span>View Y Origin</span>
+                        <span class="value-display" id="perspectiveYValue">50%</span>
+                    </label>
+                    <input type="range" id="perspectiveY" min="0" max="100" step="1" value="50">
+                </div>
             </div>
-        </div>
 
-        <div class="control-section">
-            <h3>Select Lane to Adjust</h3>
-            <div class="lane-select">
-                <button onclick="selectLane('all')" class="active" id="btnAll">ALL</button>
-                <button onclick="selectLane(1)" id="btn1">L1</button>
-                <button onclick="selectLane(2)" id="btn2">L2</button>
-                <button onclick="selectLane(3)" id="btn3">L3</button>
-                <button onclick="selectLane(4)" id="btn4">L4</button>
-                <button onclick="selectLane(5)" id="btn5">L5</button>
-                <button onclick="selectLane(6)" id="btn6">L6</button>
-                <button onclick="selectLane(7)" id="btn7">L7</button>
-                <button onclick="selectLane(8)" id="btn8">L8</button>
-            </div>
+            <div class="control-section">
+                <h3>Select Lane to Adjust</h3>
+                <div class="lane-select">
+                    <button onclick="selectLane('all')" class="active" id="btnAll">ALL</button>
+                    <button onclick="selectLane(1)" id="btn1">L1</button>
+                    <button onclick="selectLane(2)" id="btn2">L2</button>
+                    <button onclick="selectLane(3)" id="btn3">L3</button>
+                    <button onclick="selectLane(4)" id="btn4">L4</button>
+                    <button onclick="selectLane(5)" id="btn5">L5</button>
+                    <button onclick="selectLane(6)" id="btn6">L6</button>
+                    <button onclick="selectLane(7)" id="btn7">L7</button>
+                    <button onclick="selectLane(8)" id="btn8">L8</button>
+                </div>
 
-            <span class="all-lanes-label" id="controlLabel">Adjusting: ALL LANES</span>
+                <span class="all-lanes-label" id="controlLabel">Adjusting: ALL LANES</span>
 
-            <div class="control-group">
-                <label>
-                    <span>Rotate X (Tilt)</span>
-                    <span class="value-display" id="rotateXValue">0Â°</span>
-                </label>
-                <input type="range" id="rotateX" min="0" max="90" step="0.5" value="0">
-            </div>
+                <div class="control-group">
+                    <label>
+                        <span>Rotate X (Tilt)</span>
+                        <span class="value-display" id="rotateXValue">0Â°</span>
+                    </label>
+                    <input type="range" id="rotateX" min="0" max="90" step="0.5" value="0">
+                </div>
 
-            <div class="control-group">
-                <label>
-                    <span>Rotate Y (Turn)</span>
-                    <span class="value-display" id="rotateYValue">0Â°</span>
-                </label>
-                <input type="range" id="rotateY" min="-45" max="45" step="0.5" value="0">
-            </div>
+                <div class="control-group">
+                    <label>
+                        <span>Rotate Y (Turn)</span>
+                        <span class="value-display" id="rotateYValue">0Â°</span>
+                    </label>
+                    <input type="range" id="rotateY" min="-45" max="45" step="0.5" value="0">
+                </div>
 
-            <div class="control-group">
-                <label>
-                    <span>Rotate Z (Roll)</span>
-                    <span class="value-display" id="rotateZValue">0Â°</span>
-                </label>
-                <input type="range" id="rotateZ" min="-15" max="15" step="0.1" value="0">
-            </div>
+                <div class="control-group">
+                    <label>
+                        <span>Rotate Z (Roll)</span>
+                        <span class="value-display" id="rotateZValue">0Â°</span>
+                    </label>
+                    <input type="range" id="rotateZ" min="-15" max="15" step="0.1" value="0">
+                </div>
 
-            <div class="control-group">
-                <label>
-                    <span>Translate X (Left/Right)</span>
-                    <span class="value-display" id="translateXValue">0px</span>
-                </label>
-                <input type="range" id="translateX" min="-500" max="500" step="5" value="0">
-            </div>
+                <div class="control-group">
+                    <label>
+                        <span>Translate X (Left/Right)</span>
+                        <span class="value-display" id="translateXValue">0px</span>
+                    </label>
+                    <input type="range" id="translateX" min="-500" max="500" step="5" value="0">
+                </div>
 
-            <div class="control-group">
-                <label>
-                    <span>Translate Y (Up/Down)</span>
-                    <span class="value-display" id="translateYValue">0px</span>
-                </label>
-                <input type="range" id="translateY" min="-500" max="500" step="5" value="0">
-            </div>
+                <div class="control-group">
+                    <label>
+                        <span>Translate Y (Up/Down)</span>
+                        <span class="value-display" id="translateYValue">0px</span>
+                    </label>
+                    <input type="range" id="translateY" min="-500" max="500" step="5" value="0">
+                </div>
 
-            <div class="control-group">
-                <label>
-                    <span>Translate Z (Depth)</span>
-                    <span class="value-display" id="translateZValue">0px</span>
-                </label>
-                <input type="range" id="translateZ" min="-800" max="400" step="10" value="0">
+                <div class="control-group">
+                    <label>
+                        <span>Translate Z (Depth)</span>
+                        <span class="value-display" id="translateZValue">0px</span>
+                    </label>
+                    <input type="range" id="translateZ" min="-800" max="400" step="10" value="0">
+                </div>
             </div>
-        </div>
 
-        <div class="control-section">
-            <h3>Quick Presets</h3>
-            <div class="preset-buttons">
-                <button onclick="applyPreset('flat')">Flat View</button>
-                <button onclick="applyPreset('broadcast')">Broadcast</button>
-                <button onclick="applyPreset('olympic')">Olympic</button>
-                <button onclick="applyPreset('overhead')">Overhead</button>
+            <div class="control-section">
+                <h3>Quick Presets</h3>
+                <div class="preset-buttons">
+                    <button onclick="applyPreset('flat')">Flat View</button>
+                    <button onclick="applyPreset('broadcast')">Broadcast</button>
+                    <button onclick="applyPreset('olympic')">Olympic</button>
+                    <button onclick="applyPreset('overhead')">Overhead</button>
+                </div>
             </div>
-        </div>
 
-        <div class="button-group">
-            <button onclick="resetSelected()" class="secondary">Reset Selected</button>
-            <button onclick="copySettings()">Copy Values</button>
-        </div>
+            <div class="button-group">
+                <button onclick="resetSelected()" class="secondary">Reset Selected</button>
+                <button onclick="copySettings()">Copy Values</button>
+            </div>
 
-        <div style="margin-top: 12px; padding: 12px; background: rgba(0, 217, 255, 0.2); border-radius: 8px; text-align: center; color: #00D9FF; font-size: 12px;">
-            Each result = bottom of cube â€¢ Rotate cube to project
+            <div style="margin-top: 12px; padding: 12px; background: rgba(0, 217, 255, 0.2); border-radius: 8px; text-align: center; color: #00D9FF; font-size: 12px;">
+                Each result = bottom of cube â€¢ Rotate cube to project
+            </div>
         </div>
-    </div>
+    </template>
 
     <script>
         // Cube projection settings
         const cubeSettings = {
             perspective: 1500,
             perspectiveX: 50,
-            perspectiveY: 50,
-            lanes: {
-                1: { rotateX: 0, rotateY: 0, rotateZ: 0, translateX: 0, translateY: 0, translateZ: 0 },
-                2: { rotateX: 0, rotateY: 0, rotateZ: 0, translateX: 0, translateY: 0, translateZ: 0 },
-                3: { rotateX: 0, rotateY: 0, rotateZ: 0, translateX: 0, translateY: 0, translateZ: 0 },
-                4: { rotateX: 0, rotateY: 0, rotateZ: 0, translateX: 0, translateY: 0, translateZ: 0 },
-                5: { rotateX: 0, rotateY: 0, rotateZ: 0, translateX: 0, translateY: 0, translateZ: 0 },
-                6: { rotateX: 0, rotateY: 0, rotateZ: 0, translateX: 0, translateY: 0, translateZ: 0 },
-                7: { rotateX: 0, rotateY: 0, rotateZ: 0, translateX: 0, translateY: 0, translateZ: 0 },
-                8: { rotateX: 0, rotateY: 0, rotateZ: 0, translateX: 0, translateY: 0, translateZ: 0 }
-            }
+            perspectiveY: 50
         };
 
+        // Per-lane cube transforms packed into one array: laneTransforms[(lane - 1) * FIELD_COUNT + FIELD.x]
+        const TRANSFORM_PROPS = ['rotateX', 'rotateY', 'rotateZ', 'translateX', 'translateY', 'translateZ'];
+        const FIELD = { rotateX: 0, rotateY: 1, rotateZ: 2, translateX: 3, translateY: 4, translateZ: 5 };
+        const TRANSFORM_SET = new Set(TRANSFORM_PROPS);
+        const FIELD_COUNT = 6;
+        const laneTransforms = new Float64Array(8 * FIELD_COUNT);
+        // Custom properties read by the .container transform rule: [name, field, unit]
+        const TRANSFORM_PROPERTIES = [
+            ['--tx', FIELD.translateX, 'px'],
+            ['--ty', FIELD.translateY, 'px'],
+            ['--tz', FIELD.translateZ, 'px'],
+            ['--rx', FIELD.rotateX, 'deg'],
+            ['--ry', FIELD.rotateY, 'deg'],
+            ['--rz', FIELD.rotateZ, 'deg']
+        ];
+        // Lanes carrying their own custom properties rather than inheriting the wrapper's (bit lane - 1)
+        let laneOverrides = 0;
+
         let selectedLane = 'all';
         let isInteracting = false;
         let interactTimeout = null;
         let laneResults = {};
 
+        // DOM handles looked up once at load (cubes/laneButtons index 0 = lane 1).
+        // The cubes are the finish-row containers, shared with the results script's laneList.
+        const els = { wrapper: null, cubes: [], laneButtons: [], sliders: {}, values: {}, btnAll: null, controlLabel: null, panel: null };
 
-        window.addEventListener('load', function() {
+        function cacheElements() {
+            els.wrapper = document.getElementById('laneWrapper');
+            for (let i = 1; i <= 8; i++) {
+                els.cubes.push(laneList[i - 1]);
+            }
+        }
+
+        function ensurePanel() {
+            if (els.panel) return els.panel;
+            document.body.appendChild(document.getElementById('panelTpl').content.cloneNode(true));
+            for (let i = 1; i <= 8; i++) {
+                els.laneButtons.push(document.getElementById('btn' + i));
+            }
+            ['perspective', 'perspectiveX', 'perspectiveY'].concat(TRANSFORM_PROPS).forEach(key => {
+                els.sliders[key] = document.getElementById(key);
+                els.values[key] = document.getElementById(key + 'Value');
+            });
+            els.btnAll = document.getElementById('btnAll');
+            els.controlLabel = document.getElementById('controlLabel');
+            els.panel = document.getElementById('controlPanel');
             setupCubeControls();
+            return els.panel;
+        }
+
+        function setAllLaneTransforms(rotateX, translateZ) {
+            laneTransforms.fill(0);
+            for (let base = 0; base < laneTransforms.length; base += FIELD_COUNT) {
+                laneTransforms[base + FIELD.rotateX] = rotateX;
+                laneTransforms[base + FIELD.translateZ] = translateZ;
+            }
+        }
+
+
+        window.addEventListener('load', function() {
+            cacheElements();
             applyCubeTransforms();
             detectInteractMode();
         });
 
         function detectInteractMode() {
-            const panel = document.getElementById('controlPanel');
+            let mmScheduled = false;
 
+            // Pointer motion is handled at most once per frame
             document.addEventListener('mousemove', () => {
-                if (!isInteracting) {
-                    isInteracting = true;
-                    panel.classList.add('visible');
-                }
-                
-                clearTimeout(interactTimeout);
-                interactTimeout = setTimeout(() => {
-                    isInteracting = false;
-                    panel.classList.remove('visible');
-                }, 3000);
+                if (mmScheduled) return;
+                mmScheduled = true;
+                requestAnimationFrame(() => {
+                    mmScheduled = false;
+                    if (!isInteracting) {
+                        isInteracting = true;
+                        ensurePanel().classList.add('visible');
+                    }
+
+                    clearTimeout(interactTimeout);
+                    interactTimeout = setTimeout(() => {
+                        isInteracting = false;
+                        els.panel.classList.remove('visible');
+                    }, 3000);
+                });
             });
 
             document.addEventListener('click', () => {
                 isInteracting = true;
-                panel.classList.add('visible');
+                ensurePanel().classList.add('visible');
                 
                 clearTimeout(interactTimeout);
                 interactTimeout = setTimeout(() => {
                     isInteracting = false;
-                    panel.classList.remove('visible');
+                    els.panel.classList.remove('visible');
                 }, 5000);
             });
         }
@@ -2593,199 +3024,283 @@ window.addEventListener('beforeunload', () => {
         function selectLane(lane) {
             selectedLane = lane;
             
-            document.querySelectorAll('.lane-select button').forEach(btn => {
+            els.btnAll.classList.remove('active');
+            els.laneButtons.forEach(btn => {
                 btn.classList.remove('active');
             });
             
             if (lane === 'all') {
-                document.getElementById('btnAll').classList.add('active');
-                document.getElementById('controlLabel').textContent = 'Adjusting: ALL LANES';
+                els.btnAll.classList.add('active');
+                els.controlLabel.textContent = 'Adjusting: ALL LANES';
             } else {
-                document.getElementById('btn' + lane).classList.add('active');
-                document.getElementById('controlLabel').textContent = 'Adjusting: LANE ' + lane;
+                els.laneButtons[lane - 1].classList.add('active');
+                els.controlLabel.textContent = 'Adjusting: LANE ' + lane;
             }
             
             updateSlidersForSelection();
         }
 
-        function updateSlidersForSelection() {
-            const settings = selectedLane === 'all' ? cubeSettings.lanes[1] : cubeSettings.lanes[selectedLane];
-            document.getElementById('rotateX').value = settings.rotateX;
-            document.getElementById('rotateY').value = settings.rotateY;
-            document.getElementById('rotateZ').value = settings.rotateZ;
-            document.getElementById('translateX').value = settings.translateX;
-            document.getElementById('translateY').value = settings.translateY;
-            document.getElementById('translateZ').value = settings.translateZ;
-            updateValueDisplays();
+        // Offset of the selected lane (lane 1 stands in for ALL) in laneTransforms
+        function selectedBase() {
+            return ((selectedLane === 'all' ? 1 : selectedLane) - 1) * FIELD_COUNT;
+        }
+
+        function updateSlidersForSelection() {
+            const base = selectedBase();
+            for (const prop of TRANSFORM_PROPS) {
+                els.sliders[prop].value = laneTransforms[base + FIELD[prop]];
+            }
+            updateValueDisplays(base);
+        }
+
+        const shownValues = {};
+
+        function setValueText(key, text) {
+            if (shownValues[key] === text) return;
+            shownValues[key] = text;
+            els.values[key].textContent = text;
         }
 
-        function updateValueDisplays() {
-            document.getElementById('perspectiveValue').textContent = cubeSettings.perspective + 'px';
-            document.getElementById('perspectiveXValue').textContent = cubeSettings.perspectiveX + '%';
-            document.getElementById('perspectiveYValue').textContent = cubeSettings.perspectiveY + '%';
-            document.getElementById('rotateXValue').textContent = document.getElementById('rotateX').value + 'Â°';
-            document.getElementById('rotateYValue').textContent = document.getElementById('rotateY').value + 'Â°';
-            document.getElementById('rotateZValue').textContent = document.getElementById('rotateZ').value + 'Â°';
-            document.getElementById('translateXValue').textContent = document.getElementById('translateX').value + 'px';
-            document.getElementById('translateYValue').textContent = document.getElementById('translateY').value + 'px';
-            document.getElementById('translateZValue').textContent = document.getElementById('translateZ').value + 'px';
+        // Value spans render straight from cubeSettings/laneTransforms; the sliders are never read back
+        function updateValueDisplays(base = selectedBase()) {
+            setValueText('perspective', cubeSettings.perspective + 'px');
+            setValueText('perspectiveX', cubeSettings.perspectiveX + '%');
+            setValueText('perspectiveY', cubeSettings.perspectiveY + '%');
+            setValueText('rotateX', laneTransforms[base + FIELD.rotateX] + 'Â°');
+            setValueText('rotateY', laneTransforms[base + FIELD.rotateY] + 'Â°');
+            setValueText('rotateZ', laneTransforms[base + FIELD.rotateZ] + 'Â°');
+            setValueText('translateX', laneTransforms[base + FIELD.translateX] + 'px');
+            setValueText('translateY', laneTransforms[base + FIELD.translateY] + 'px');
+            setValueText('translateZ', laneTransforms[base + FIELD.translateZ] + 'px');
         }
 
-        function setupCubeControls() {
-            document.getElementById('perspective').addEventListener('input', (e) => {
-                cubeSettings.perspective = parseFloat(e.target.value);
-                document.body.style.perspective = cubeSettings.perspective + 'px';
-                updateValueDisplays();
-            });
+        // Cube styles are written from one flush per frame: slider input and presets only mark what changed
+        let rafPending = false;
+        let pendingPerspective = false;
+        // Lanes whose transform changed since the last flush (bit lane - 1)
+        let dirtyLanes = 0;
+        const ALL_LANES_MASK = 0xFF;
 
-            document.getElementById('perspectiveX').addEventListener('input', (e) => {
-                cubeSettings.perspectiveX = parseFloat(e.target.value);
+        function flushCubeStyles() {
+            if (pendingPerspective) {
+                pendingPerspective = false;
+                document.body.style.perspective = cubeSettings.perspective + 'px';
                 document.body.style.perspectiveOrigin = `${cubeSettings.perspectiveX}% ${cubeSettings.perspectiveY}%`;
-                updateValueDisplays();
-            });
+            }
+            if (dirtyLanes === ALL_LANES_MASK) {
+                applyCubeTransforms('all');
+            } else {
+                for (let i = 1; i <= 8; i++) {
+                    if (dirtyLanes & (1 << (i - 1))) applyCubeTransforms(i);
+                }
+            }
+            dirtyLanes = 0;
+            updateValueDisplays();
+        }
 
-            document.getElementById('perspectiveY').addEventListener('input', (e) => {
-                cubeSettings.perspectiveY = parseFloat(e.target.value);
-                document.body.style.perspectiveOrigin = `${cubeSettings.perspectiveX}% ${cubeSettings.perspectiveY}%`;
-                updateValueDisplays();
+        function scheduleCubeFlush() {
+            if (rafPending) return;
+            rafPending = true;
+            requestAnimationFrame(() => {
+                rafPending = false;
+                flushCubeStyles();
             });
+        }
 
-            ['rotateX', 'rotateY', 'rotateZ', 'translateX', 'translateY', 'translateZ'].forEach(prop => {
-                document.getElementById(prop).addEventListener('input', (e) => {
-                    const value = parseFloat(e.target.value);
-                    if (selectedLane === 'all') {
-                        for (let i = 1; i <= 8; i++) {
-                            cubeSettings.lanes[i][prop] = value;
-                        }
-                    } else {
-                        cubeSettings.lanes[selectedLane][prop] = value;
+        function setupCubeControls() {
+            // Input only records the value (valueAsNumber, no string parse); styles go out from the per-frame flush.
+            els.panel.addEventListener('input', (e) => {
+                const id = e.target.id;
+                if (id === 'perspective' || id === 'perspectiveX' || id === 'perspectiveY') {
+                    cubeSettings[id] = e.target.valueAsNumber;
+                    pendingPerspective = true;
+                    scheduleCubeFlush();
+                    return;
+                }
+                if (!TRANSFORM_SET.has(id)) return;
+                const field = FIELD[id];
+                const value = e.target.valueAsNumber;
+                if (selectedLane === 'all') {
+                    for (let base = 0; base < laneTransforms.length; base += FIELD_COUNT) {
+                        laneTransforms[base + field] = value;
                     }
-                    applyCubeTransforms();
-                    updateValueDisplays();
-                });
+                } else {
+                    laneTransforms[(selectedLane - 1) * FIELD_COUNT + field] = value;
+                }
+                dirtyLanes |= selectedLane === 'all' ? ALL_LANES_MASK : 1 << (selectedLane - 1);
+                scheduleCubeFlush();
             });
 
             updateValueDisplays();
         }
 
-        function applyCubeTransforms() {
+        function writeTransformProperties(style, base) {
+            for (const [name, field, unit] of TRANSFORM_PROPERTIES) {
+                style.setProperty(name, laneTransforms[base + field] + unit);
+            }
+        }
+
+        function lanesUniform() {
+            for (let base = FIELD_COUNT; base < laneTransforms.length; base += FIELD_COUNT) {
+                for (let k = 0; k < FIELD_COUNT; k++) {
+                    if (laneTransforms[base + k] !== laneTransforms[k]) return false;
+                }
+            }
+            return true;
+        }
+
+        function applyLaneTransform(i) {
+            writeTransformProperties(els.cubes[i - 1].style, (i - 1) * FIELD_COUNT);
+            laneOverrides |= 1 << (i - 1);
+        }
+
+        // Rewrite only the cube that changed. For all lanes, identical settings become one write on the
+        // wrapper that every container inherits; otherwise each lane gets its own properties.
+        function applyCubeTransforms(which) {
+            if (which !== undefined && which !== 'all') {
+                applyLaneTransform(which);
+                return;
+            }
+            if (lanesUniform()) {
+                writeTransformProperties(els.wrapper.style, 0);
+                for (let i = 0; i < 8; i++) {
+                    if (laneOverrides & (1 << i)) {
+                        for (const [name] of TRANSFORM_PROPERTIES) {
+                            els.cubes[i].style.removeProperty(name);
+                        }
+                    }
+                }
+                laneOverrides = 0;
+                return;
+            }
             for (let i = 1; i <= 8; i++) {
-                const container = document.getElementById(i.toString());
-                const settings = cubeSettings.lanes[i];
-                
-                container.style.transform = `
-                    translateX(${settings.translateX}px)
-                    translateY(${settings.translateY}px)
-                    translateZ(${settings.translateZ}px)
-                    rotateX(${settings.rotateX}deg)
-                    rotateY(${settings.rotateY}deg)
-                    rotateZ(${settings.rotateZ}deg)
-                `;
+                applyLaneTransform(i);
             }
         }
 
         function applyPreset(preset) {
             switch(preset) {
                 case 'flat':
-                    for (let i = 1; i <= 8; i++) {
-                        cubeSettings.lanes[i] = {
-                            rotateX: 0, rotateY: 0, rotateZ: 0,
-                            translateX: 0, translateY: 0, translateZ: 0
-                        };
-                    }
+                    laneTransforms.fill(0);
                     break;
                 case 'broadcast':
                     cubeSettings.perspective = 1500;
                     cubeSettings.perspectiveX = 50;
                     cubeSettings.perspectiveY = 50;
-                    for (let i = 1; i <= 8; i++) {
-                        cubeSettings.lanes[i] = {
-                            rotateX: 60, rotateY: 0, rotateZ: 0,
-                            translateX: 0, translateY: 0, translateZ: -100
-                        };
-                    }
+                    setAllLaneTransforms(60, -100);
                     break;
                 case 'olympic':
                     cubeSettings.perspective = 1800;
                     cubeSettings.perspectiveX = 50;
                     cubeSettings.perspectiveY = 40;
-                    for (let i = 1; i <= 8; i++) {
-                        cubeSettings.lanes[i] = {
-                            rotateX: 65, rotateY: 0, rotateZ: 0,
-                            translateX: 0, translateY: 0, translateZ: -150
-                        };
-                    }
+                    setAllLaneTransforms(65, -150);
                     break;
                 case 'overhead':
                     cubeSettings.perspective = 2000;
                     cubeSettings.perspectiveX = 50;
                     cubeSettings.perspectiveY = 50;
-                    for (let i = 1; i <= 8; i++) {
-                        cubeSettings.lanes[i] = {
-                            rotateX: 80, rotateY: 0, rotateZ: 0,
-                            translateX: 0, translateY: 0, translateZ: -200
-                        };
-                    }
+                    setAllLaneTransforms(80, -200);
                     break;
             }
             
-            document.body.style.perspective = cubeSettings.perspective + 'px';
-            document.body.style.perspectiveOrigin = `${cubeSettings.perspectiveX}% ${cubeSettings.perspectiveY}%`;
-            document.getElementById('perspective').value = cubeSettings.perspective;
-            document.getElementById('perspectiveX').value = cubeSettings.perspectiveX;
-            document.getElementById('perspectiveY').value = cubeSettings.perspectiveY;
-            
+            els.sliders.perspective.value = cubeSettings.perspective;
+            els.sliders.perspectiveX.value = cubeSettings.perspectiveX;
+            els.sliders.perspectiveY.value = cubeSettings.perspectiveY;
             updateSlidersForSelection();
-            applyCubeTransforms();
+
+            // Perspective and cube styles go out through the same per-frame flush as slider input
+            pendingPerspective = true;
+            dirtyLanes = ALL_LANES_MASK;
+            scheduleCubeFlush();
         }
 
         function resetSelected() {
+            const changed = selectedLane === 'all' ? ALL_LANES_MASK : 1 << (selectedLane - 1);
             if (selectedLane === 'all') {
-                for (let i = 1; i <= 8; i++) {
-                    cubeSettings.lanes[i] = { rotateX: 0, rotateY: 0, rotateZ: 0, translateX: 0, translateY: 0, translateZ: 0 };
-                }
+                laneTransforms.fill(0);
             } else {
-                cubeSettings.lanes[selectedLane] = { rotateX: 0, rotateY: 0, rotateZ: 0, translateX: 0, translateY: 0, translateZ: 0 };
+                const base = (selectedLane - 1) * FIELD_COUNT;
+                laneTransforms.fill(0, base, base + FIELD_COUNT);
             }
             
             updateSlidersForSelection();
-            applyCubeTransforms();
+            dirtyLanes |= changed;
+            scheduleCubeFlush();
         }
 
         function copySettings() {
-            let text = `CAMERA PERSPECTIVE:\nperspective: ${cubeSettings.perspective}px\nperspectiveX: ${cubeSettings.perspectiveX}%\nperspectiveY: ${cubeSettings.perspectiveY}%\n\nLANE TRANSFORMS:\n`;
+            const parts = [`CAMERA PERSPECTIVE:\nperspective: ${cubeSettings.perspective}px\nperspectiveX: ${cubeSettings.perspectiveX}%\nperspectiveY: ${cubeSettings.perspectiveY}%\n\nLANE TRANSFORMS:\n`];
             for (let i = 1; i <= 8; i++) {
-                const s = cubeSettings.lanes[i];
-                text += `Lane ${i}: rotateX=${s.rotateX}Â° rotateY=${s.rotateY}Â° rotateZ=${s.rotateZ}Â° translateX=${s.translateX}px translateY=${s.translateY}px translateZ=${s.translateZ}px\n`;
+                const base = (i - 1) * FIELD_COUNT;
+                parts.push(
+                    'Lane ', i,
+                    ': rotateX=', laneTransforms[base + FIELD.rotateX],
+                    'Â° rotateY=', laneTransforms[base + FIELD.rotateY],
+                    'Â° rotateZ=', laneTransforms[base + FIELD.rotateZ],
+                    'Â° translateX=', laneTransforms[base + FIELD.translateX],
+                    'px translateY=', laneTransforms[base + FIELD.translateY],
+                    'px translateZ=', laneTransforms[base + FIELD.translateZ],
+                    'px\\n'
+                );
             }
-            navigator.clipboard.writeText(text).then(() => alert('Settings copied to clipboard!'));
+            navigator.clipboard.writeText(parts.join('')).then(() => alert('Settings copied to clipboard!'));
         }
     </script>
 
     <script>
-        function formatTime(time) {
-            return time.replace(/^0+:?0*/, '') || '0.00';
-        }
-
-        function formatName(fullName) {
-            return fullName.trim().split(' ').map(function(word) {
-                return word.charAt(0).toUpperCase() + word.slice(1).toLowerCase();
-            }).join(' ');
-        }
+        // Finish row layout (px)
+        const TOTAL_WIDTH = 850;
+        const FIXED_PAD = 88 + 16; // LaneNumber box + container gaps
+        const DEFAULT_TIME_WIDTH = 200;
+        const TIME_PAD = 32;
+        const NAME_PAD = 32;
+
+        // Measured widths keyed by font + text; a Map keeps insertion order, so the first key is the
+        // least recently used once hits are re-inserted. Finish times repeat across heats.
+        const textWidthCache = new Map();
+        const TEXT_WIDTH_CACHE_MAX = 500;
+
+        // One small offscreen context serves every measurement; its font is only reassigned when it changes
+        const measureCanvas = document.createElement('canvas');
+        measureCanvas.width = 10;
+        measureCanvas.height = 10;
+        const measureContext = measureCanvas.getContext('2d');
+        let measureFont = '';
 
         function measureTextWidth(text, fontSize, fontWeight) {
-            const canvas = document.createElement('canvas');
-            const context = canvas.getContext('2d');
-            context.font = fontWeight + ' ' + fontSize + 'px Helvetica';
-            return context.measureText(text).width;
+            const font = fontWeight + ' ' + fontSize + 'px Helvetica';
+            const key = font + '\\u0001' + text;
+            let width = textWidthCache.get(key);
+            if (width !== undefined) {
+                textWidthCache.delete(key);
+                textWidthCache.set(key, width);
+                return width;
+            }
+            if (measureFont !== font) {
+                measureContext.font = font;
+                measureFont = font;
+            }
+            width = measureContext.measureText(text).width;
+            textWidthCache.set(key, width);
+            if (textWidthCache.size > TEXT_WIDTH_CACHE_MAX) {
+                textWidthCache.delete(textWidthCache.keys().next().value);
+            }
+            return width;
         }
 
-        function adjustFontSize(element, maxWidth) {
-            let fontSize = parseInt(window.getComputedStyle(element).fontSize, 10);
-            
-            while (element.offsetWidth > maxWidth && fontSize > 1) {
-                fontSize -= 1;
-                element.style.fontSize = fontSize + 'px';
+        // Shrink each [element, maxWidth] pair's text to fit. Text width scales with font size, so every
+        // element is measured once, all reads before any write, and the fitted size is written once.
+        function fitFontSizes(fits) {
+            const measured = fits.map(([element]) => [
+                parseInt(window.getComputedStyle(element).fontSize, 10),
+                element.offsetWidth
+            ]);
+            for (let i = 0; i < fits.length; i++) {
+                const [element, maxWidth] = fits[i];
+                const [fontSize, width] = measured[i];
+                if (width > maxWidth) {
+                    element.style.fontSize = Math.max(1, Math.floor(fontSize * maxWidth / width)) + 'px';
+                }
             }
         }
 
@@ -2797,83 +3312,91 @@ window.addEventListener('beforeunload', () => {
             hideTimeout: null
         };
 
+        // Lane containers and their children looked up once (index 0 = lane 1)
+        const laneList = [];
+        const laneParts = [];
+        for (let i = 1; i <= 8; i++) {
+            const container = document.getElementById(String(i));
+            laneList.push(container);
+            laneParts.push({
+                info: container.querySelector('.SwimmerInfo'),
+                timeBox: container.querySelector('.SwimmerTime'),
+                name: container.querySelector('.SwimmerInfo .name'),
+                time: container.querySelector('.SwimmerTime .time'),
+                position: container.querySelector('.LaneNumber .position')
+            });
+        }
+
+        // Finishes are applied once per frame: every DOM write first, then a single reflow to restart
+        // the reveal animations, then name fitting (reads, then writes) after the next paint
+        const pendingFinishes = new Map(); // lane -> finishTime, newest wins
+        let finishFlushScheduled = false;
+
         function updateFinishTime(data) {
             const lane = data.finishTime.lane;
-            const place = data.finishTime.place;
-            const fullName = data.finishTime.swimmer;
-            const time = data.finishTime.time;
-
-       
 
             raceState.lastFinishTime = Date.now();
             
             // Track this lane as finished
             raceState.finishedLanes.add(lane);
 
-            const container = document.getElementById(lane);
+            if (!laneList[lane - 1]) {
+                console.error('[FINISH] Could not find container with lane id:', lane);
+                return;
+            }
+
+            pendingFinishes.set(lane, data.finishTime);
+            if (finishFlushScheduled) return;
+            finishFlushScheduled = true;
+            requestAnimationFrame(flushFinishes);
+        }
 
-            if (container) {
-        
+        function flushFinishes() {
+            finishFlushScheduled = false;
+            const fits = [];
 
-                const formattedName = formatName(fullName);
-                const formattedTime = formatTime(time);
+            pendingFinishes.forEach((finish, lane) => {
+                const container = laneList[lane - 1];
+                const parts = laneParts[lane - 1];
+                // Name and time arrive pre-formatted from the server
+                const formattedTime = finish.displayTime;
 
-                const defaultTimeWidth = 200;
-                const actualTimeWidth = measureTextWidth(formattedTime, 48, 'bold') + 32;
-                const timeWidth = Math.max(defaultTimeWidth, actualTimeWidth);
-                
-                const timeBox = container.querySelector('.SwimmerTime');
-                timeBox.style.width = timeWidth + 'px';
+                const actualTimeWidth = measureTextWidth(formattedTime, 48, 'bold') + TIME_PAD;
+                const timeWidth = actualTimeWidth > DEFAULT_TIME_WIDTH ? actualTimeWidth : DEFAULT_TIME_WIDTH;
+                parts.timeBox.style.width = timeWidth + 'px';
 
-                const totalWidth = 850;
-                const swimmerInfoWidth = totalWidth - timeWidth - 88 - 16;
-                const swimmerInfoBox = container.querySelector('.SwimmerInfo');
-                swimmerInfoBox.style.width = swimmerInfoWidth + 'px';
+                const swimmerInfoWidth = TOTAL_WIDTH - timeWidth - FIXED_PAD;
+                parts.info.style.width = swimmerInfoWidth + 'px';
 
-                const timeElement = container.querySelector('.SwimmerTime .time');
-                if (timeElement) {
-                    timeElement.textContent = formattedTime;
+                if (parts.time) {
+                    parts.time.textContent = formattedTime;
                 }
 
-                const nameElement = container.querySelector('.SwimmerInfo .name');
+                const nameElement = parts.name;
                 if (nameElement) {
-                    nameElement.textContent = formattedName;
+                    nameElement.textContent = finish.displayName;
                     nameElement.style.fontSize = '52px';
-                    
-                    setTimeout(function() {
-                        const maxNameWidth = swimmerInfoWidth - 32;
-                        adjustFontSize(nameElement, maxNameWidth);
-                    }, 10);
+                    fits.push([nameElement, swimmerInfoWidth - NAME_PAD]);
                 }
 
-                const positionElement = container.querySelector('.LaneNumber .position');
-                if (positionElement) {
-                    positionElement.textContent = place;
+                if (parts.position) {
+                    parts.position.textContent = finish.place;
                 }
 
                 container.style.visibility = 'visible';
                 container.style.opacity = '1';
+                container.classList.remove('finish');
+            });
 
-                const swimmerInfo = container.querySelector('.SwimmerInfo');
-                const swimmerTime = container.querySelector('.SwimmerTime');
-                const laneNumber = container.querySelector('.LaneNumber');
-                
-                swimmerInfo.style.animation = 'none';
-                swimmerTime.style.animation = 'none';
-                laneNumber.style.animation = 'none';
-
-                void swimmerInfo.offsetWidth;
-                void swimmerTime.offsetWidth;
-                void laneNumber.offsetWidth;
-
-                swimmerInfo.style.animation = 'fadeInFromLeft 1s ease forwards';
-                swimmerTime.style.animation = 'fadeInFromLeft 1s ease forwards';
-                swimmerTime.style.animationDelay = '0.5s';
-                laneNumber.style.animation = 'expandPosition 1s ease forwards';
-                laneNumber.style.animationDelay = '1s';
+            // One reflow restarts every lane's reveal sequence with a single class flip
+            void document.body.offsetWidth;
+            pendingFinishes.forEach((finish, lane) => {
+                laneList[lane - 1].classList.add('finish');
+            });
+            pendingFinishes.clear();
 
-            } else {
-                console.error('[FINISH] Could not find container with lane id:', lane);
+            if (fits.length) {
+                requestAnimationFrame(() => fitFontSizes(fits));
             }
         }
 
@@ -2897,41 +3420,35 @@ window.addEventListener('beforeunload', () => {
 
 
         function hideAndResetContainers() {
-            const containers = document.querySelectorAll('.container');
-
-            containers.forEach(function(container) {
-                container.classList.add('fade-out');
-            });
+            for (let i = 0; i < 8; i++) {
+                laneList[i].classList.add('fade-out');
+            }
 
-            setTimeout(function() {
-                containers.forEach(function(container) {
-                    const positionElement = container.querySelector('.LaneNumber .position');
+            // The reset is write-only and lands in a frame, alongside any finish flush
+            setTimeout(() => requestAnimationFrame(function() {
+                for (let i = 0; i < 8; i++) {
+                    const container = laneList[i];
+                    const parts = laneParts[i];
+                    const positionElement = parts.position;
                     if (positionElement) positionElement.textContent = '';
 
-                    const nameElement = container.querySelector('.SwimmerInfo .name');
+                    const nameElement = parts.name;
                     if (nameElement) {
                         nameElement.textContent = '';
                         nameElement.style.fontSize = '52px';
                     }
 
-                    const timeElement = container.querySelector('.SwimmerTime .time');
+                    const timeElement = parts.time;
                     if (timeElement) timeElement.textContent = '';
 
                     container.style.visibility = 'hidden';
                     container.style.opacity = '0';
                     container.classList.remove('fade-out');
+                    container.classList.remove('finish');
 
-                    container.querySelector('.SwimmerInfo').style.width = '';
-                    container.querySelector('.SwimmerTime').style.width = '';
-
-                    const swimmerInfo = container.querySelector('.SwimmerInfo');
-                    const swimmerTime = container.querySelector('.SwimmerTime');
-                    const laneNumber = container.querySelector('.LaneNumber');
-                    
-                    if (swimmerInfo) swimmerInfo.style.animation = 'none';
-                    if (swimmerTime) swimmerTime.style.animation = 'none';
-                    if (laneNumber) laneNumber.style.animation = 'none';
-                });
+                    parts.info.style.width = '';
+                    parts.timeBox.style.width = '';
+                }
 
                 raceState = {
                     activeLanes: [],
@@ -2940,7 +3457,7 @@ window.addEventListener('beforeunload', () => {
                     lastFinishTime: null,
                     hideTimeout: null
                 };
-            }, 1000);
+            }), 1000);
         }
 
         function trackSplitLane(data) {
@@ -2969,8 +3486,7 @@ window.addEventListener('beforeunload', () => {
                 console.log('[WS] Connected to Swim Live System');
             };
 
-            ws.onmessage = function(event) {
-                const data = JSON.parse(event.data);
+            const handleMessage = function(data) {
 
 
                 if (data.status === "SAVED") {
@@ -2994,6 +3510,12 @@ window.addEventListener('beforeunload', () => {
                 }
             };
 
+            ws.onmessage = function(event) {
+                const payload = JSON.parse(event.data);
+                if (Array.isArray(payload)) payload.forEach(handleMessage);
+                else handleMessage(payload);
+            };
+
             ws.onclose = function() {
                 console.log('[WS] Connection closed. Reconnecting...');
                 setTimeout(connectWebSocket, 1000);
@@ -5198,9 +5720,8 @@ window.addEventListener('beforeunload', () => {
             console.log('[WS] âœ… Connected to Swim Live System');
         };
 
-        ws.onmessage = function(event) {
+        function handleMessage(data) {
             try {
-                const data = JSON.parse(event.data);
                 console.log('[WS] ðŸ“¨ Received:', data);
 
                 // Handle event name update
@@ -5254,9 +5775,21 @@ window.addEventListener('beforeunload', () => {
                     displayState.resultsLocked = true;
                 }
 
+            } catch (error) {
+                console.error('[WS] âŒ Error handling message:', error);
+            }
+        }
+
+        ws.onmessage = function(event) {
+            let payload;
+            try {
+                payload = JSON.parse(event.data);
             } catch (error) {
                 console.error('[WS] âŒ Error parsing message:', error);
+                return;
             }
+            if (Array.isArray(payload)) payload.forEach(handleMessage);
+            else handleMessage(payload);
         };
 
         ws.onerror = function(error) {
@@ -5286,19 +5819,56 @@ window.addEventListener('beforeunload', () => {
 </script>'''
         
         # Write HTML files
-        with open(self.html_dir / "EventTimer.html", 'w', encoding='utf-8') as f:
-            f.write(event_timer_html)
-        with open(self.html_dir / "LaneStarts.html", 'w', encoding='utf-8') as f:
-            f.write(lane_starts_html)
-        with open(self.html_dir / "SplitTimes.html", 'w', encoding='utf-8') as f:
-            f.write(split_times_html)
-        with open(self.html_dir / "LaneEnds.html", 'w', encoding='utf-8') as f:
-            f.write(lane_ends_html)
-        with open(self.html_dir / "Announcer.html", 'w', encoding='utf-8') as f:
-            f.write(announcer_html)
-        
-        print(f"[OK] Generated HTML files in: {self.html_dir}")
+        written = 0
+        for filename, content in (
+            ("EventTimer.html", event_timer_html),
+            ("LaneStarts.html", lane_starts_html),
+            ("SplitTimes.html", split_times_html),
+            ("LaneEnds.html", lane_ends_html),
+            ("Announcer.html", announcer_html),
+        ):
+            written += self._write_if_changed(self.html_dir / filename, content)
+        
+        if written:
+            print(f"[OK] Generated {written} HTML file(s) in: {self.html_dir}")
+        else:
+            print(f"[OK] HTML files up to date in: {self.html_dir}")
+    
+    def _write_if_changed(self, path: Path, content: str) -> bool:
+        """Write a text file unless it already holds exactly this content. Returns True if written."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                if f.read() == content:
+                    return False
+        except (OSError, UnicodeDecodeError):
+            pass
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return True
 
+    def _run_obs_worker(self) -> None:
+        """Run queued OBS requests one at a time until a None sentinel is queued."""
+        while True:
+            task = self.obs_queue.get()
+            if task is None:
+                break
+            try:
+                task()
+            except Exception as e:
+                print(f"[OBS] Request failed: {e}")
+    
+    def _request_obs_scene_lock(self) -> None:
+        """Queue a scene lock check unless one is still waiting to run."""
+        if not self.obs or self._obs_lock_pending:
+            return
+        self._obs_lock_pending = True
+        self.obs_queue.put(self._run_obs_scene_lock)
+    
+    def _run_obs_scene_lock(self) -> None:
+        """OBS worker task for a queued scene lock check."""
+        self._obs_lock_pending = False
+        self._ensure_obs_scene_lock()
+    
     def _ensure_obs_scene_lock(self):
         """Keep OBS on 'Blocks' scene when timer is not running - DEBUG VERSION."""
         if not self.obs:
@@ -5309,11 +5879,11 @@ window.addEventListener('beforeunload', () => {
             return
         
         try:
-            response = self.obs.call(requests.GetCurrentProgramScene())
+            response = self.obs.call(obs_requests.GetCurrentProgramScene())
             current_scene = response.datain.get('currentProgramSceneName', '')
             
             if current_scene != "Blocks":
-                self.obs.call(requests.SetCurrentProgramScene(sceneName="Blocks"))
+                self.obs.call(obs_requests.SetCurrentProgramScene(sceneName="Blocks"))
             else:
                 pass
         except Exception as e:
@@ -5332,10 +5902,14 @@ window.addEventListener('beforeunload', () => {
             
         # If timer just stopped
         elif not new_running_state and self.timer_running:
-            try:
-                self.obs.call(requests.SetCurrentProgramScene(scene_name="Blocks"))
-            except Exception as e:
-                pass
+            self.obs_queue.put(self._set_obs_scene_blocks)
+    
+    def _set_obs_scene_blocks(self):
+        """OBS worker task: switch to 'Blocks' when the timer stops."""
+        try:
+            self.obs.call(obs_requests.SetCurrentProgramScene(scene_name="Blocks"))
+        except Exception as e:
+            pass
 
 
     
@@ -5349,7 +5923,7 @@ window.addEventListener('beforeunload', () => {
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 return [line.rstrip() for line in f.readlines()]
-        except (FileNotFoundError, IOError):
+        except (OSError, ValueError):  # ValueError: not valid UTF-8
             return []
 
     def _extract_distance_from_event_name(self, event_name: str) -> Optional[int]:
@@ -5456,11 +6030,25 @@ window.addEventListener('beforeunload', () => {
             club_code = parts[1].strip()
             if ',' in name_part:
                 surname, forename = name_part.split(',', 1)
-                return {"name": f"{forename.strip()} {surname.strip()}", "club": club_code}
+                name = f"{forename.strip()} {surname.strip()}"
             else:
-                return {"name": name_part, "club": club_code}
+                name = name_part
+            return {"name": name, "club": club_code, "displayName": self._format_display_name(name)}
         except Exception:
             return {"name": "", "club": ""}
+
+    def _format_display_name(self, name: str) -> str:
+        """Title-case each word of a swimmer name for on-screen display."""
+        return " ".join(word[:1].upper() + word[1:].lower() for word in name.strip().split(" "))
+
+    def _format_display_time(self, time_str: str) -> str:
+        """Drop leading zero minutes/seconds from a MM:SS.HH time (e.g. 00:05.23 -> 5.23)."""
+        if not time_str.startswith("0"):
+            return time_str
+        trimmed = time_str.lstrip("0")
+        if trimmed.startswith(":"):
+            trimmed = trimmed[1:].lstrip("0")
+        return trimmed or "0.00"
     
     def _get_swimmers_for_heat(self, event_id: str, heat_num: str) -> Dict[str, Dict[str, str]]:
         """Get swimmers for a specific heat."""
@@ -5473,40 +6061,135 @@ window.addEventListener('beforeunload', () => {
                 return default
         except ValueError:
             return default
+        event_heats = self.heat_cache.get(event_id)
+        if event_heats is not None and heat_number in event_heats:
+            return event_heats[heat_number]
         all_heats = self._parse_swimmer_data(event_id)
         if not all_heats or heat_number > len(all_heats):
             return default
         heat_swimmers = all_heats[heat_number - 1]
-        return {str(i): self._format_swimmer_data(swimmer_data) for i, swimmer_data in enumerate(heat_swimmers, 1)}
+        swimmers = {str(i): self._format_swimmer_data(swimmer_data) for i, swimmer_data in enumerate(heat_swimmers, 1)}
+        self.heat_cache.setdefault(event_id, {})[heat_number] = swimmers
+        return swimmers
+    
+    def _preload_event_files(self) -> None:
+        """Parse every event file already on disk so heat changes are served from the caches."""
+        count = 0
+        for path in self.event_files_path.glob("E*.scb"):
+            event_id = path.stem[1:]
+            self._get_event_name(event_id)
+            for heat_number in range(1, len(self._parse_swimmer_data(event_id)) + 1):
+                self._get_swimmers_for_heat(event_id, str(heat_number))
+            count += 1
+        if count:
+            print(f"[OK] Preloaded {count} event file(s)")
         
     def _process_byte(self, byte_in: int) -> None:
         """Process incoming byte from CTS Gen7."""
-        if byte_in > self.CONTROL_BYTE_THRESHOLD:
-            self.stream_state["data_readout"] = (byte_in & 1) == 0
-            self.stream_state["channel"] = ((byte_in >> 1) & 0x1F) ^ 0x1F
-            channel = self.stream_state["channel"]
-            if channel >= self.CHANNELS:
-                return
-            if byte_in > self.CLEAR_CHANNEL_THRESHOLD:
-                self.display[channel] = [self.SPACE_ASCII] * self.CHARS_PER_CHANNEL
-        else:
-            if not self.stream_state["data_readout"]:
-                return
-            segment_num = (byte_in & 0xF0) >> 4
-            if segment_num >= self.CHARS_PER_CHANNEL:
-                return
-            segment_data = byte_in & 0x0F
-            channel = self.stream_state["channel"]
-            if channel > 0 and segment_data == 0:
-                self.display[channel][segment_num] = self.SPACE_ASCII
-            else:
-                self.display[channel][segment_num] = (segment_data ^ 0x0F) + 48
+        self._process_bytes(bytes((byte_in,)))
+
+    def _process_bytes(self, data) -> None:
+        """Process a chunk of bytes from CTS Gen7.
+
+        Runs the stream state machine over the whole chunk in one call, keeping
+        the state and constants in locals instead of paying a method call and
+        attribute lookups per byte.
+        """
+        if _parse_cts_chunk_jit is not None and len(data) >= self.JIT_MIN_CHUNK:
+            self._process_bytes_jit(data)
+            return
+        if self._display_arr is not None and len(data) >= self.NUMPY_MIN_CHUNK:
+            self._process_bytes_numpy(data)
+            return
+        
+        display = self.display
+        chars_per_channel = self.CHARS_PER_CHANNEL
+        blank_channel = bytes([self.SPACE_ASCII]) * chars_per_channel
+        control_threshold = self.CONTROL_BYTE_THRESHOLD
+        control_actions = self._control_actions
+        data_readout = self.stream_state["data_readout"]
+        channel = self.stream_state["channel"]
+        base = channel * chars_per_channel  # Offset of the current channel in display
+        chars = self._digit_chars if channel == 0 else self._digit_chars_blank_zero
+        
+        for byte_in in data:
+            if byte_in > control_threshold:
+                # One table lookup replaces the control-byte bit twiddling
+                data_readout, channel, base, chars, clears = control_actions[byte_in]
+                if clears:
+                    display[base:base + chars_per_channel] = blank_channel
+            elif data_readout:
+                # Data bytes are <= 0x7F, so the segment number (high nibble) is always < 8
+                display[base + (byte_in >> 4)] = chars[byte_in]
+        
+        self.stream_state["data_readout"] = data_readout
+        self.stream_state["channel"] = channel
+    
+    def _process_bytes_jit(self, data) -> None:
+        """Run the Numba-compiled parser over a chunk, writing through the display view."""
+        state = _parse_cts_chunk_jit(
+            np.frombuffer(data, dtype=np.uint8), self._display_arr,
+            self.stream_state["data_readout"], self.stream_state["channel"],
+            self.CONTROL_BYTE_THRESHOLD, self.CLEAR_CHANNEL_THRESHOLD, self.SPACE_ASCII
+        )
+        self.stream_state["data_readout"] = bool(state & 1)
+        self.stream_state["channel"] = state >> 1
+    
+    def _process_bytes_numpy(self, data) -> None:
+        """Vectorized equivalent of _process_bytes for large chunks (e.g. a read backlog).
+
+        Works out which control byte governs each data byte, drops writes that a later
+        channel clear would erase, and keeps only the last write per display cell, then
+        applies the clears and writes through the display view in two assignments.
+        """
+        arr = np.frombuffer(data, dtype=np.uint8)
+        positions = np.arange(arr.size)
+        is_control = arr > self.CONTROL_BYTE_THRESHOLD
+        control_channel = ((arr >> 1) & 0x1F).astype(np.intp) ^ 0x1F
+        control_readout = (arr & 1) == 0
+        
+        # Position of the control byte in effect at each byte (-1 = state carried in).
+        # A running max is cheaper here than searchsorted over the control positions.
+        owner = np.maximum.accumulate(np.where(is_control, positions, -1))
+        last_control = int(owner[-1]) if owner.size else -1
+        carried = owner < 0
+        owner[carried] = 0
+        channel = np.where(carried, self.stream_state["channel"], control_channel[owner])
+        readout = np.where(carried, self.stream_state["data_readout"], control_readout[owner])
+        
+        # Last clear per channel; earlier writes to that channel are wiped by it
+        last_clear = np.full(self.CHANNELS, -1, dtype=np.intp)
+        clear_pos = np.flatnonzero(arr > self.CLEAR_CHANNEL_THRESHOLD)
+        np.maximum.at(last_clear, control_channel[clear_pos], clear_pos)
+        
+        # Data bytes are <= 0x7F, so the segment number is always < CHARS_PER_CHANNEL
+        write_pos = np.flatnonzero(~is_control & readout & (positions > last_clear[channel]))
+        write_channel = channel[write_pos]
+        segment_data = arr[write_pos] & 0x0F
+        values = np.where(
+            (write_channel > 0) & (segment_data == 0),
+            self.SPACE_ASCII,
+            (segment_data ^ 0x0F).astype(np.intp) + 48
+        )
+        cells = write_channel * self.CHARS_PER_CHANNEL + (arr[write_pos] >> 4)
+        
+        # Keep the last write to each cell
+        _, last_in_reversed = np.unique(cells[::-1], return_index=True)
+        keep = write_pos.size - 1 - last_in_reversed
+        
+        display_arr = self._display_arr
+        display_arr[last_clear >= 0] = self.SPACE_ASCII
+        display_arr.reshape(-1)[cells[keep]] = values[keep]
+        
+        if last_control >= 0:
+            self.stream_state["data_readout"] = bool(control_readout[last_control])
+            self.stream_state["channel"] = int(control_channel[last_control])
     
     def _get_char(self, channel: int, offset: int) -> str:
         """Get character from display buffer."""
         if channel >= self.CHANNELS or offset >= self.CHARS_PER_CHANNEL:
             return self.BLANK_CHAR
-        ch = self.display[channel][offset]
+        ch = self.display[channel * self.CHARS_PER_CHANNEL + offset]
         return self.BLANK_CHAR if ch in (self.SPACE_ASCII, 63) else chr(ch)
     
     def _get_event_and_heat(self) -> Tuple[str, str]:
@@ -5528,6 +6211,7 @@ window.addEventListener('beforeunload', () => {
 
     def _get_lane_time(self, lane: int) -> tuple:
         """Extract finish time and place for a specific lane (1-8).
+        Also records the place-slot kind in self.lane_place_kind[lane].
         Returns: (time_string, place_string)
         """
         if lane < 1 or lane > 8:
@@ -5564,8 +6248,17 @@ window.addEventListener('beforeunload', () => {
         
         # If seconds are all zeros/spaces, no valid time
         if seconds == "00" and hundredths == "00" and minutes == "00":
+            self.lane_place_kind[lane] = self.PLACE_EMPTY
             return ("", "")
         
+        # Classify the place slot once here so callers don't re-inspect the string
+        if place_str.isdigit():
+            self.lane_place_kind[lane] = self.PLACE_DIGIT
+        elif place_str:
+            self.lane_place_kind[lane] = self.PLACE_DQ
+        else:
+            self.lane_place_kind[lane] = self.PLACE_EMPTY
+        
         time_str = f"{minutes}:{seconds}.{hundredths}"
         
         return (time_str, place_str)
@@ -5594,52 +6287,45 @@ window.addEventListener('beforeunload', () => {
     def _check_lane_activity(self) -> None:
         """Check which lanes are active (turned ON on console AND have a swimmer).
         Simple check: if position 0 has the lane number, it's ON.
-        Uses debouncing to filter out mid-read glitches.
+        Uses debouncing to filter out mid-read glitches. Called every LANE_CHECK_INTERVAL.
         """
-        current_time = time.time()
-        
-        # Check every 0.3 seconds
-        if current_time - self.last_lane_check_time < 0.3:
-            return
-        
-        self.last_lane_check_time = current_time
-        
-        current_active = set()
+        current_active = 0
         
         # Check both: lane is ON AND has a swimmer
         for lane in range(1, 9):
-            lane_str = str(lane)
-            
             # Check if lane is turned ON (position 0 shows lane number)
             is_on = self._is_lane_active(lane)
             
             # Check if lane has a swimmer assigned
-            swimmer_info = self.last_swimmers.get(lane_str, {})
+            swimmer_info = self.last_swimmers.get(self.LANE_KEYS[lane], {})
             has_swimmer = bool(swimmer_info.get("name", "").strip())
             
             # Lane is only active if BOTH conditions are met
             if is_on and has_swimmer:
-                current_active.add(lane)
+                current_active |= 1 << lane
         
         # Debouncing: require same state 2 times in a row before accepting
-        if not hasattr(self, '_pending_active_lanes'):
-            self._pending_active_lanes = None
-        
         if current_active == self._pending_active_lanes:
             # Same state as last check, this is stable - send it if different from current
             if current_active != self.last_active_lanes:
+                active_list = self._lanes_from_mask(current_active)
                 lane_activity_data = {
-                    "activeLanes": sorted(list(current_active)),
-                    "totalActive": len(current_active)
+                    "activeLanes": active_list,
+                    "totalActive": len(active_list)
                 }
                 self._send_websocket_data(lane_activity_data)
                 
-                self.last_active_lanes = current_active.copy()
+                self.last_active_lanes = current_active
                 self.active_lanes = current_active
+                self._state_version += 1
         
         # Update pending state for next check
         self._pending_active_lanes = current_active
     
+    def _lanes_from_mask(self, mask: int) -> List[int]:
+        """Expand a lane bitmask into a sorted list of lane numbers."""
+        return [lane for lane in range(1, 9) if mask & (1 << lane)]
+    
     def _parse_time_to_seconds(self, time_str: str) -> Optional[float]:
         """Convert time string to seconds."""
         try:
@@ -5672,21 +6358,36 @@ window.addEventListener('beforeunload', () => {
         if not self.active_lanes or self.expected_times_per_lane == 0:
             return False
         
-        for lane in self.active_lanes:
-            lane_str = str(lane)
-            
+        for lane in self._lanes_from_mask(self.active_lanes):
             # Check if the lane has received the required number of times
-            if self.lane_time_counts.get(lane_str, 0) < self.expected_times_per_lane:
+            if self.lane_time_counts[lane] < self.expected_times_per_lane:
                 return False
         
         # All active lanes have received their final expected time
         return True
     
     def _send_websocket_data(self, data: Dict) -> None:
-        """Queue data to be sent to WebSocket clients."""
-        if self.running:
-            self.data_queue.put(data)
-
+        """Queue data to be sent to WebSocket clients (safe to call from any thread)."""
+        loop = self.loop
+        if not self.running or loop is None:
+            return  # Server not up yet, so there are no clients to send to
+        self.outbox.append(data)
+        # Waking the loop costs a syscall, so only do it once per drain
+        if not self._wakeup_pending:
+            self._wakeup_pending = True
+            try:
+                loop.call_soon_threadsafe(self._outbox_ready.set)
+            except RuntimeError:
+                pass  # Loop closed during shutdown
+
+    def _reset_heat_state(self) -> None:
+        """Clear per-lane results for a new event or heat (lane lists are reset in place)."""
+        self.last_finish_times[:] = self._NO_FINISH_TIMES
+        self.lane_time_counts[:] = self._NO_TIME_COUNTS
+        self._heat_results = []  # Replaced, not cleared: the replay cache is keyed on the list
+        self._saved_sent_for_heat = False
+        self._dq_sent_for_heat = 0
+    
     def _handle_event_change(self, event: str, heat: str) -> None:
         """Handle event/heat changes."""
         data_to_send = {}
@@ -5700,7 +6401,7 @@ window.addEventListener('beforeunload', () => {
             swimmers = self._get_swimmers_for_heat(event, heat)
             self.last_swimmers = swimmers
             data_to_send["lanes"] = swimmers
-            self.last_finish_times = {}
+            self._reset_heat_state()
             # Calculate expected times per lane based on distance
             distance = self._extract_distance_from_event_name(event_name)
             if distance:
@@ -5708,12 +6409,6 @@ window.addEventListener('beforeunload', () => {
             else:
                 self.expected_times_per_lane = 1  # Default to finish only
 
-            # Reset lane time counters
-            self.lane_time_counts = {str(i): 0 for i in range(1, 9)}
-            # Reset saved state for new event
-            self._saved_sent_for_heat = False
-            self._dq_sent_for_heat = set()
-
             print(f"[{time.strftime('%H:%M:%S')}] Event: {event_name} | Heat: {heat}")
             print(f"[INFO] Distance: {distance}m - Expecting {self.expected_times_per_lane} time(s) per lane")
         elif heat != self.last_heat:
@@ -5722,21 +6417,20 @@ window.addEventListener('beforeunload', () => {
             swimmers = self._get_swimmers_for_heat(event, heat)
             self.last_swimmers = swimmers
             data_to_send["lanes"] = swimmers
-            self.last_finish_times = {}
-            self.lane_time_counts = {str(i): 0 for i in range(1, 9)}
-
-            self._saved_sent_for_heat = False
-            self._dq_sent_for_heat = set()
+            self._reset_heat_state()
             
             print(f"[{time.strftime('%H:%M:%S')}] Heat changed: {display_heat}")
         
+        self.last_event, self.last_heat = event, heat
+        
         if data_to_send:
+            # Bump only once every field the initial frame reads is in place
+            self._state_version += 1
             self._send_websocket_data(data_to_send)
-        
-        self.last_event, self.last_heat = event, heat
     
     def _handle_time_update(self, race_time: str) -> None:
         """Handle race time updates with improved accuracy."""
+        was_running = self.timer_running
         current_seconds = self._parse_time_to_seconds(race_time)
         cleaned = race_time.replace(" ", "").replace(":", "").replace(".", "")
         is_empty = cleaned == "" or not any(c.isdigit() and c != '0' for c in cleaned)
@@ -5757,25 +6451,36 @@ window.addEventListener('beforeunload', () => {
             # Apply latency compensation to get closer to real timer
             compensated_time = current_seconds + self.TIMER_LATENCY_COMPENSATION
             
+            now = time.time()
             if not self.timer_running:
                 self._handle_timer_state_change(True)
                 self.timer_running = True
-                self.timer_start_time = time.time()
+                self.timer_start_time = time.monotonic()
                 self.timer_offset = compensated_time
                 # Send timer sync AND active lanes when timer starts
+                active_list = self._lanes_from_mask(self.active_lanes)
                 self._send_websocket_data({
-                    "timerSync": {"running": True, "time": compensated_time, "timestamp": time.time()},
-                    "activeLanes": sorted(list(self.active_lanes)),
-                    "totalActive": len(self.active_lanes)
+                    "timerSync": {"running": True, "time": compensated_time, "timestamp": now},
+                    "activeLanes": active_list,
+                    "totalActive": len(active_list)
                 })
+                self._last_sync_time = now
+                self._last_sync_value = compensated_time
                 print(f"[{time.strftime('%H:%M:%S')}] Timer started: {race_time}")
             else:
-                # More frequent syncs for better accuracy
-                if time.time() - self._last_sync_time >= self.TIMER_SYNC_INTERVAL:
-                    self._send_websocket_data({"timerSync": {"running": True, "time": compensated_time, "timestamp": time.time()}})
-                    self._last_sync_time = time.time()
+                # Clients run the clock from the last sync, so only resync when
+                # they would have drifted or the steady-state interval is up
+                since_sync = now - self._last_sync_time
+                drift = abs(compensated_time - (self._last_sync_value + since_sync))
+                if since_sync >= self.TIMER_SYNC_INTERVAL or drift >= self.TIMER_SYNC_DRIFT:
+                    self._send_websocket_data({"timerSync": {"running": True, "time": compensated_time, "timestamp": now}})
+                    self._last_sync_time = now
+                    self._last_sync_value = compensated_time
         
         self.last_race_time = race_time
+        if self.timer_running != was_running:
+            # After last_race_time, so a frame cached under the new version has the new clock
+            self._state_version += 1
 
     def _handle_finish_times(self) -> None:
         """Check and handle finish time updates for all lanes."""
@@ -5783,50 +6488,60 @@ window.addEventListener('beforeunload', () => {
         if not self.timer_running:
             return
         
+        # The clock is only read when a DQ has to be checked, and the log timestamp
+        # is formatted at most once per poll
+        ts_str = None
+        current_race_seconds = self._parse_time_to_seconds(self.last_race_time)
+        lane_keys = self.LANE_KEYS
+        last_finish_times = self.last_finish_times
+        lane_place_kind = self.lane_place_kind
+        PLACE_DQ = self.PLACE_DQ
+        PLACE_DIGIT = self.PLACE_DIGIT
+        
         for lane in range(1, 9):
             lane_time, place = self._get_lane_time(lane)
-            lane_str = str(lane)
+            lane_bit = 1 << lane
+            swimmer_info = self.last_swimmers.get(lane_keys[lane], {})
 
             # Check for a DQ flag (often placed in the 'place' slot as a non-digit character)
-            is_dq = bool(place.strip()) and not place.strip().isdigit()
+            place_kind = lane_place_kind[lane]
+            is_dq = place_kind == PLACE_DQ
             
             if is_dq:
                 
                 # NEW LOGIC START: Check if DQ for this lane has already been sent
-                if lane in self._dq_sent_for_heat:
-                    self.last_finish_times[lane_str] = "DQ" # Still mark as DQ to prevent time processing
+                if self._dq_sent_for_heat & lane_bit:
+                    last_finish_times[lane] = "DQ" # Still mark as DQ to prevent time processing
                     continue
                 
                 if self.timer_running and self.timer_start_time is not None:
-                    elapsed_time = time.time() - self.timer_start_time
+                    elapsed_time = time.monotonic() - self.timer_start_time
                     if elapsed_time < self.DQ_STALE_TIMEOUT:
-                        # Log the filtering action and skip sending
-                        swimmer_info = self.last_swimmers.get(lane_str, {})
-                        swimmer_name = swimmer_info.get("name", f"Lane {lane}")
-                        
                         # We still set last_finish_times to DQ to avoid processing as a time later
-                        self.last_finish_times[lane_str] = "DQ"
+                        last_finish_times[lane] = "DQ"
                         continue 
                 # --- END DQ TIMEOUT CHECK ---
                 
-                # Get swimmer info for console log
-                swimmer_info = self.last_swimmers.get(lane_str, {})
                 swimmer_name = swimmer_info.get("name", f"Lane {lane}")
                 
                 # Log and mark as sent
-                print(f"[{time.strftime('%H:%M:%S')}] --- DQ FLAG SENT --- Lane: {lane} | Swimmer: {swimmer_name} | Code: {place.strip()}")
-                self._dq_sent_for_heat.add(lane)
+                if ts_str is None:
+                    ts_str = time.strftime('%H:%M:%S')
+                print(f"[{ts_str}] --- DQ FLAG SENT --- Lane: {lane} | Swimmer: {swimmer_name} | Code: {place}")
+                self._dq_sent_for_heat |= lane_bit
                 
                 # Send the simplified WebSocket message
-                self._send_websocket_data({
+                dq_data = {
                     "disqualification": {
                         "lane": lane,
                         "tag": "disqualification"
                     }
-                })
+                }
+                self._send_websocket_data(dq_data)
+                self._heat_results.append(dq_data)
                 
                 # Mark as DQ to prevent future time processing for this lane
-                self.last_finish_times[lane_str] = "DQ" 
+                last_finish_times[lane] = "DQ" 
                 continue # Skip the rest of the time processing loop
             # --- END NEW BLOCK ---
             
@@ -5835,63 +6550,26 @@ window.addEventListener('beforeunload', () => {
                 continue
 
             # Ignore times in the first second of race - these are old times from previous race
-            if self.timer_running:
-                current_race_time = self._parse_time_to_seconds(self.last_race_time)
-                if current_race_time and current_race_time < 1.0:
-                    continue
+            if current_race_seconds and current_race_seconds < 1.0:
+                continue
                     
-            # Clean the time string (remove spaces)
-            time_cleaned = lane_time.replace(" ", "")
-            
             # Skip if same as last time
-            if time_cleaned == self.last_finish_times.get(lane_str, ""):
-                continue
-            
-            # Validate: must have colon and decimal point
-            if ':' not in time_cleaned or '.' not in time_cleaned:
+            if lane_time == last_finish_times[lane]:
                 continue
             
-            # Check if it has actual digit content (not all zeros/spaces)
-            digits_only = time_cleaned.replace(":", "").replace(".", "")
-            if not any(c.isdigit() and c != '0' for c in digits_only):
+            # Validate and split MM:SS.HH in one pass
+            match = self._TIME_RE.match(lane_time)
+            if not match:
                 continue
+            minutes, seconds, hundredths = match.groups()
             
-            # Must have at least 3 meaningful digits
-            meaningful_digits = [c for c in digits_only if c.isdigit() and c != '0']
-            if len(meaningful_digits) < 2:
+            # Must have at least 2 meaningful (non-zero) digits
+            if len((minutes + seconds + hundredths).replace('0', '')) < 2:
                 continue
             
-            try:
-                # Parse and format properly
-                parts = time_cleaned.split(':')
-                if len(parts) != 2:
-                    continue
-                
-                seconds_part = parts[1]
-                if '.' not in seconds_part:
-                    continue
-                
-                sec_split = seconds_part.split('.')
-                if len(sec_split) != 2:
-                    continue
-                
-                # Build formatted time with zero-padding
-                minutes = parts[0].strip() if parts[0].strip() and parts[0].strip().isdigit() else '00'
-                seconds = sec_split[0].strip() if sec_split[0].strip() else '00'
-                hundredths = sec_split[1].strip() if sec_split[1].strip() else '00'
-                
-                # Pad to 2 digits
-                minutes = minutes.zfill(2)
-                seconds = seconds.zfill(2)
-                hundredths = hundredths.ljust(2, '0')[:2]
-                
-                formatted_time = f"{minutes}:{seconds}.{hundredths}"
-                
-            except (ValueError, IndexError) as e:
-                continue
+            # Zero-pad to MM:SS.HH
+            formatted_time = f"{minutes.zfill(2)}:{seconds.zfill(2)}.{hundredths.ljust(2, '0')[:2]}"
             
-            # Get swimmer info
-            swimmer_info = self.last_swimmers.get(lane_str, {})
             swimmer_name = swimmer_info.get("name", "")
             
             # Skip if no swimmer in this lane
@@ -5899,11 +6577,11 @@ window.addEventListener('beforeunload', () => {
                 continue
             
             # Store the finish time
-            self.last_finish_times[lane_str] = time_cleaned
+            last_finish_times[lane] = lane_time
 
             # Increment time count for this lane
-            self.lane_time_counts[lane_str] += 1
-            time_number = self.lane_time_counts[lane_str]
+            self.lane_time_counts[lane] += 1
+            time_number = self.lane_time_counts[lane]
 
             # Determine if this is a split or finish time
             if time_number < self.expected_times_per_lane:
@@ -5913,22 +6591,23 @@ window.addEventListener('beforeunload', () => {
                 time_type = "FINISH"
                 time_label = "Finish"
 
-            # Format place display (show for both splits and finishes)
-            place_display = f", {place}" if place and place.isdigit() else ""
-
             # Send to WebSocket clients
             finish_data = {
                 "finishTime": {
                     "lane": lane,
                     "time": formatted_time,
-                    "place": place if place and place.isdigit() else "",
+                    "place": place if place_kind == PLACE_DIGIT else "",
                     "swimmer": swimmer_name,
+                    "displayName": swimmer_info.get("displayName", swimmer_name),
+                    "displayTime": self._format_display_time(formatted_time),
                     "type": time_type,
                     "timeNumber": time_number,
                     "label": time_label
                 }
             }
             self._send_websocket_data(finish_data)
+            if time_type == "FINISH":
+                self._heat_results.append(finish_data)
 
     
     # COM Port File Receiver Methods
@@ -5944,53 +6623,79 @@ window.addEventListener('beforeunload', () => {
                 # Read data with non-blocking timeout
                 data = self.receiver_serial.read(4096)
                 if data:
-                    # Decode and add to line buffer
+                    # Add to line buffer; packets are parsed straight from bytes
                     try:
-                        decoded = data.decode('utf-8', errors='ignore')
-                        self.com_line_buffer += decoded
+                        line_buffer = self.com_line_buffer
+                        line_buffer += data
                         
-                        # Process complete lines
-                        while '\n' in self.com_line_buffer:
-                            line, self.com_line_buffer = self.com_line_buffer.split('\n', 1)
-                            if line.strip():
-                                self._process_com_packet(line.strip())
+                        # Process complete lines, then drop them from the buffer in one go
+                        start = 0
+                        end = line_buffer.find(b'\n')
+                        while end >= 0:
+                            line = line_buffer[start:end].strip()
+                            if line:
+                                self._process_com_packet(line)
+                            start = end + 1
+                            end = line_buffer.find(b'\n', start)
+                        if start:
+                            del line_buffer[:start]
                     except Exception as e:
                         print(f"[ERROR] Decode error: {e}")
                 else:
                     # Small sleep when no data
                     time.sleep(0.001)
+                
+                # Abandoned transfers are cleaned up here so only this thread touches com_buffers
+                if self.com_buffers:
+                    now = time.time()
+                    if now - self._com_last_gc >= 1.0:
+                        self._com_last_gc = now
+                        self._discard_stale_com_transfers(now)
                     
             except Exception as e:
                 if self.running:
                     print(f"[ERROR] COM receiver error: {e}")
                 time.sleep(0.1)
     
-    def _process_com_packet(self, packet_str: str) -> None:
-        """Process incoming COM packet."""
+    def _process_com_packet(self, packet: bytes) -> None:
+        """Process incoming COM packet (one JSON line, as bytes or str)."""
         try:
-            if not packet_str:
+            if not packet:
                 return
             
-            header_json = json.loads(packet_str)
-            name = header_json.get("name")
-            seq = header_json.get("seq")
-            final = header_json.get("final", False)
-            size = header_json.get("size", 0)
-            content_b64 = header_json.get("content", "")
-            
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler covers both
+            header_json = orjson.loads(packet) if orjson is not None else json.loads(packet)
+            get = header_json.get
+            name = get("name")
             if not name:
                 return
+            seq = get("seq")
+            final = get("final", False)
+            size = get("size", 0)
+            content_b64 = get("content", "")
             
             key = name
             if key not in self.com_buffers:
-                self.com_buffers[key] = {"parts": {}, "final": False, "size": size}
+                part_path = self.event_files_path / (name + ".part")
+                self.com_buffers[key] = {
+                    "fp": open(part_path, "wb"),  # In-order contents streamed straight to disk
+                    "part_path": part_path,
+                    "total": 0,
+                    "chunks": 0,
+                    "next_seq": 0,  # Every chunk below this has been written to fp
+                    "pending": {},  # Out-of-order chunks waiting for a gap to fill
+                    "final": False,
+                    "size": size,
+                    "last_seen": time.time()
+                }
             
             buf = self.com_buffers[key]
+            buf["last_seen"] = time.time()
             
             if not final and content_b64:
                 try:
                     rawbytes = base64.b64decode(content_b64)
-                    buf["parts"][seq] = rawbytes
+                    self._append_com_chunk(buf, seq, rawbytes)
                     print(f"[RX] Received chunk {seq} for {name} ({len(rawbytes)} bytes)")
                 except Exception as e:
                     print(f"[ERROR] Base64 decode error: {e}")
@@ -6000,7 +6705,7 @@ window.addEventListener('beforeunload', () => {
                 print(f"[OK] Final marker received for {name}")
             
             # If complete, save file immediately
-            if buf["final"] and buf["parts"]:
+            if buf["final"] and buf["chunks"]:
                 self._save_complete_file(name, buf)
                 
         except json.JSONDecodeError as e:
@@ -6008,24 +6713,57 @@ window.addEventListener('beforeunload', () => {
         except Exception as e:
             print(f"[ERROR] Error processing COM packet: {e}")
     
+    def _append_com_chunk(self, buf: Dict, seq, rawbytes: bytes) -> None:
+        """Append a decoded chunk to its transfer buffer, holding back out-of-order chunks.
+
+        Sequence numbers count up from 0. Chunks arrive through a UDP forwarder and may
+        be reordered, so anything ahead of next_seq waits in pending until the gap fills.
+        """
+        if not isinstance(seq, int):
+            # No position to order by: keep it in arrival order
+            buf["chunks"] += 1
+            buf["total"] += len(rawbytes)
+            buf["fp"].write(rawbytes)
+            return
+        next_seq = buf["next_seq"]
+        if seq < next_seq or seq in buf["pending"]:
+            return  # Retransmission of a chunk we already have
+        buf["chunks"] += 1
+        buf["total"] += len(rawbytes)
+        if seq != next_seq:
+            buf["pending"][seq] = rawbytes
+            return
+        write = buf["fp"].write
+        write(rawbytes)
+        next_seq += 1
+        while next_seq in buf["pending"]:
+            write(buf["pending"].pop(next_seq))
+            next_seq += 1
+        buf["next_seq"] = next_seq
+    
     def _save_complete_file(self, name: str, buf: Dict) -> None:
         """Save a complete file."""
         try:
-            indexes = sorted(buf["parts"].keys())
             outp = self.event_files_path / name
             
-            with open(outp, "wb") as f:
-                for i in indexes:
-                    f.write(buf["parts"][i])
+            fp = buf["fp"]
+            pending = buf["pending"]
+            if pending:
+                print(f"[WARN] {name} has {len(pending)} chunk(s) after a missing sequence number")
+                # Sequence numbers are dense, so walk the range instead of sorting the keys
+                fp.writelines(pending[seq] for seq in range(buf["next_seq"], max(pending) + 1) if seq in pending)
             
-            total_bytes = sum(len(buf["parts"][i]) for i in indexes)
-            print(f"[SAVED] {name} ({total_bytes} bytes, {len(indexes)} chunks)")
+            fp.close()
+            os.replace(buf["part_path"], outp)
+            
+            print(f"[SAVED] {name} ({buf['total']} bytes, {buf['chunks']} chunks)")
             
             # Clear cache for this event if it's an event file
             if name.startswith("E") and name.endswith(".scb"):
                 event_id = name[1:-4]
                 self.event_cache.pop(event_id, None)
                 self.swimmer_cache.pop(event_id, None)
+                self.heat_cache.pop(event_id, None)
             
             # Remove from buffer
             del self.com_buffers[name]
@@ -6033,27 +6771,132 @@ window.addEventListener('beforeunload', () => {
         except Exception as e:
             print(f"[ERROR] Error saving file {name}: {e}")
     
+    def _discard_com_transfer(self, name: str) -> None:
+        """Close and delete the partial file for an unfinished transfer."""
+        buf = self.com_buffers.pop(name, None)
+        if buf is None:
+            return
+        try:
+            buf["fp"].close()
+            os.remove(buf["part_path"])
+        except OSError as e:
+            print(f"[ERROR] Error removing partial file for {name}: {e}")
+    
+    def _discard_stale_com_transfers(self, now: float) -> None:
+        """Drop transfers that have not received a chunk within COM_TRANSFER_TIMEOUT."""
+        for name, buf in list(self.com_buffers.items()):
+            if now - buf["last_seen"] > self.COM_TRANSFER_TIMEOUT:
+                print(f"[WARN] Discarding incomplete transfer {name} ({buf['chunks']} chunks received)")
+                self._discard_com_transfer(name)
+    
     # WebSocket Server Methods
+    def _encode_json(self, data) -> bytes:
+        """Serialize a WebSocket payload to UTF-8, using orjson when it is installed.
+
+        Callers send the bytes with text=True so clients still get text frames
+        they can JSON.parse, without a decode/encode round trip.
+        """
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+    def _encode_split_frame(self, batch) -> Optional[bytes]:
+        """Pack the timer syncs and SPLIT finishes in a batch as binary split-times records.
+
+        Returns None when the batch holds nothing the split-times page shows.
+        """
+        out = bytearray()
+        for data in batch:
+            sync = data.get("timerSync")
+            if sync is not None:
+                out += self._SPLIT_TIMER.pack(self.SPLIT_RECORD_TIMER, 1 if sync["running"] else 0)
+            finish = data.get("finishTime")
+            if finish is not None and finish["type"] == "SPLIT":
+                place = finish["place"]
+                time_bytes = finish["time"].encode('utf-8')
+                display = finish["displayTime"].encode('utf-8')
+                name = finish["swimmer"].encode('utf-8')[:0xFFFF]
+                out += self._SPLIT_HEAD.pack(self.SPLIT_RECORD_SPLIT, finish["lane"],
+                                             int(place) if place else 0, min(finish["timeNumber"], 255))
+                out.append(len(time_bytes))
+                out += time_bytes
+                out.append(len(display))
+                out += display
+                out += self._U16.pack(len(name))
+                out += name
+        return bytes(out) if out else None
+
+    def _tune_socket(self, sock) -> None:
+        """Disable Nagle so small JSON frames are sent immediately, and enable
+        short TCP keepalives so dead clients are dropped quickly."""
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Keepalive timing options are not exposed on every platform
+            for option, value in (
+                ("TCP_KEEPIDLE", self.TCP_KEEPALIVE_IDLE),
+                ("TCP_KEEPINTVL", self.TCP_KEEPALIVE_INTERVAL),
+                ("TCP_KEEPCNT", self.TCP_KEEPALIVE_COUNT),
+            ):
+                if hasattr(socket, option):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+        except OSError as e:
+            print(f"[WS] Could not tune socket: {e}")
+
     async def _websocket_handler(self, websocket):
         """Handle individual WebSocket connections."""
-        self.websocket_clients.add(websocket)
-        print(f"[WS] Client connected (total: {len(self.websocket_clients)})")
+        self._tune_socket(websocket.transport.get_extra_info('socket'))
+        is_split = websocket.request is not None and websocket.request.path == self.WS_SPLIT_PATH
+        clients = self.split_clients if is_split else self.websocket_clients
+        clients.add(websocket)
+        print(f"[WS] Client connected (total: {len(self.websocket_clients) + len(self.split_clients)})")
         
         try:
-            initial_data = {
-                "eventName": (self.last_event_name or 'N/A').upper(),
-                "eventID": (self.last_event or "N/A"),
-                "heatName": f"HEAT {self.last_heat}" if self.last_heat else 'N/A',
-                "lanes": self.last_swimmers if self.last_swimmers else {str(i): {"name": "", "club": ""} for i in range(1, 9)},
-                "timerSync": {
-                    "running": self.timer_running,
-                    "time": self._parse_time_to_seconds(self.last_race_time) or 0.0,
-                    "timestamp": time.time()
-                },
-                "activeLanes": sorted(list(self.active_lanes)),
-                "totalActive": len(self.active_lanes)
-            }
-            await websocket.send(json.dumps(initial_data))
+            if is_split:
+                # Split-times pages only need the clock state; the results replay holds no splits
+                await websocket.send(self._SPLIT_TIMER.pack(self.SPLIT_RECORD_TIMER, 1 if self.timer_running else 0))
+                await websocket.wait_closed()
+                return
+
+            # Reuse the encoded state until something clients see changes. The
+            # timerSync time/timestamp pair stays consistent, so a cached frame
+            # still lets clients extrapolate a running clock.
+            version = self._state_version
+            cached = self._initial_state_cache
+            if cached is not None and cached[0] == version:
+                message = cached[1]
+            else:
+                active_list = self._lanes_from_mask(self.active_lanes)
+                initial_data = {
+                    "eventName": (self.last_event_name or 'N/A').upper(),
+                    "eventID": (self.last_event or "N/A"),
+                    "heatName": f"HEAT {self.last_heat}" if self.last_heat else 'N/A',
+                    "lanes": self.last_swimmers if self.last_swimmers else {str(i): {"name": "", "club": ""} for i in range(1, 9)},
+                    "timerSync": {
+                        "running": self.timer_running,
+                        "time": self._parse_time_to_seconds(self.last_race_time) or 0.0,
+                        "timestamp": time.time()
+                    },
+                    "activeLanes": active_list,
+                    "totalActive": len(active_list)
+                }
+                message = self._encode_json(initial_data)
+                self._initial_state_cache = (version, message)
+            await websocket.send(message, text=True)
+            
+            # Replay results already in for this heat, encoded once per new result
+            results = self._heat_results
+            count = len(results)
+            if count:
+                cached = self._heat_results_cache
+                if cached is not None and cached[0] is results and cached[1] == count:
+                    replay = cached[2]
+                else:
+                    replay = self._encode_json(results[:count])
+                    self._heat_results_cache = (results, count, replay)
+                await websocket.send(replay, text=True)
             
             # Keep connection alive
             await websocket.wait_closed()
@@ -6063,46 +6906,77 @@ window.addEventListener('beforeunload', () => {
         except Exception as e:
             print(f"[ERROR] WebSocket handler error: {e}")
         finally:
-            self.websocket_clients.discard(websocket)
-            print(f"[WS] Client disconnected (remaining: {len(self.websocket_clients)})")
+            clients.discard(websocket)
+            print(f"[WS] Client disconnected (remaining: {len(self.websocket_clients) + len(self.split_clients)})")
     
     async def _websocket_broadcaster(self):
-        """Broadcast data to all WebSocket clients."""
+        """Broadcast data to all WebSocket clients.
+
+        Sleeps until an update is queued, gives the rest of a burst up to
+        WS_BATCH_WINDOW to arrive, then sends everything pending as one frame:
+        a single object, or a JSON array when several arrived together.
+        Split-times clients get the same batch as one binary frame instead.
+        """
+        outbox = self.outbox
+        ready = self._outbox_ready
         while self.running:
             try:
-                if not self.data_queue.empty():
-                    data = self.data_queue.get()
-                    message = json.dumps(data)
-                    
-                    if self.websocket_clients:
-                        disconnected_clients = set()
-                        for client in list(self.websocket_clients):
-                            try:
-                                await client.send(message)
-                            except websockets.exceptions.ConnectionClosed:
-                                disconnected_clients.add(client)
-                            except Exception as e:
-                                print(f"[ERROR] Error sending to client: {e}")
-                                disconnected_clients.add(client)
-                        
-                        self.websocket_clients -= disconnected_clients
+                await ready.wait()
+                if len(outbox) < self.WS_BATCH_MAX:
+                    await asyncio.sleep(self.WS_BATCH_WINDOW)
+                ready.clear()
+                # Reset before draining so an update appended after this point schedules a new wakeup
+                self._wakeup_pending = False
+                batch = []
+                while outbox:
+                    batch.append(outbox.popleft())
+                if not batch:
+                    continue
                 
-                await asyncio.sleep(0.01)
+                if self.websocket_clients:
+                    message = self._encode_json(batch if len(batch) > 1 else batch[0])
+                    # Writes to every open client without awaiting; closed ones are skipped
+                    # and removed from websocket_clients when their handler exits
+                    websockets.broadcast(self.websocket_clients, message, text=True)
+                if self.split_clients:
+                    frame = self._encode_split_frame(batch)
+                    if frame is not None:
+                        websockets.broadcast(self.split_clients, frame)
+                self._drop_slow_clients()
             except Exception as e:
                 print(f"[ERROR] Broadcaster error: {e}")
                 await asyncio.sleep(0.1)
     
+    def _drop_slow_clients(self) -> None:
+        """Abort clients whose unsent data has backed up past WS_MAX_WRITE_BUFFER.
+
+        broadcast() never waits on a client, so a stalled browser would otherwise
+        buffer every update in memory. Aborting ends its handler, which removes it.
+        """
+        for clients in (self.websocket_clients, self.split_clients):
+            for websocket in clients:
+                transport = websocket.transport
+                if transport.get_write_buffer_size() > self.WS_MAX_WRITE_BUFFER:
+                    print(f"[WS] Dropping slow client ({transport.get_write_buffer_size()} bytes queued)")
+                    transport.abort()
+    
     def _run_websocket_server(self):
         """Run WebSocket server."""
         async def start_server():
+            # The event belongs to this loop; publish the loop last so producers see both
+            self._outbox_ready = asyncio.Event()
+            self.loop = asyncio.get_running_loop()
             try:
                 server = await websockets.serve(
                     self._websocket_handler,
                     "localhost",
                     self.WEBSOCKET_PORT,
-                    ping_interval=20,
-                    ping_timeout=10
+                    ping_interval=self.WS_PING_INTERVAL,
+                    ping_timeout=self.WS_PING_TIMEOUT,
+                    compression=self.WS_COMPRESSION
                 )
+                for sock in server.sockets:
+                    self._tune_socket(sock)
                 print(f"[WS] WebSocket server started on ws://localhost:{self.WEBSOCKET_PORT}")
                 
                 broadcaster_task = asyncio.create_task(self._websocket_broadcaster())
@@ -6124,7 +6998,18 @@ window.addEventListener('beforeunload', () => {
                 print(f"[ERROR] WebSocket server error: {e}")
         
         try:
-            asyncio.run(start_server())
+            if uvloop is not None:
+                uvloop.run(start_server())
+            elif sys.platform == "win32":
+                # The selector loop is lighter than the default Proactor loop for a few local
+                # sockets. Created here for this thread only, so the process-wide policy is untouched.
+                loop = asyncio.SelectorEventLoop()
+                try:
+                    loop.run_until_complete(start_server())
+                finally:
+                    loop.close()
+            else:
+                asyncio.run(start_server())
         except Exception as e:
             print(f"[ERROR] Failed to start WebSocket server: {e}")
     
@@ -6132,32 +7017,44 @@ window.addEventListener('beforeunload', () => {
         """Main execution loop."""
         self.running = True
         
-        # Start COM receiver thread
-        com_thread = threading.Thread(target=self._run_com_receiver, daemon=True)
-        com_thread.start()
-        
-        # Start WebSocket server thread
-        websocket_thread = threading.Thread(target=self._run_websocket_server, daemon=True)
-        websocket_thread.start()
-        
-        # Give threads time to start
-        time.sleep(0.5)
-        
-        print("\n" + "="*60)
-        print("SWIM LIVE SYSTEM STARTED")
-        print("="*60)
-        print(f"[DIR] Base directory: {self.base_dir}")
-        print(f"[DIR] Event files: {self.event_files_path}")
-        print(f"[DIR] HTML files: {self.html_dir}")
-        print(f"[CTS] CTS Port: {self.cts_port} @ {self.baud} baud")
-        print(f"[COM] Receiver Port: {self.receiver_port} @ 115200 baud")
-        print(f"[WS] WebSocket: ws://localhost:{self.WEBSOCKET_PORT}")
-        print("="*60)
-        print("\n[OK] System ready - monitoring CTS Gen7 and file receiver...")
-        print("="*60 + "\n")
-        
         try:
-            buffer = bytearray()
+            # Fill the event caches before the COM receiver can start replacing files
+            self._preload_event_files()
+            
+            # Start COM receiver thread
+            com_thread = threading.Thread(target=self._run_com_receiver, daemon=True)
+            com_thread.start()
+            
+            # Start OBS request thread
+            if self.obs:
+                obs_thread = threading.Thread(target=self._run_obs_worker, daemon=True)
+                obs_thread.start()
+            
+            # Start WebSocket server thread
+            websocket_thread = threading.Thread(target=self._run_websocket_server, daemon=True)
+            websocket_thread.start()
+            
+            # Give threads time to start
+            time.sleep(0.5)
+            
+            print("\n" + "="*60)
+            print("SWIM LIVE SYSTEM STARTED")
+            print("="*60)
+            print(f"[DIR] Base directory: {self.base_dir}")
+            print(f"[DIR] Event files: {self.event_files_path}")
+            print(f"[DIR] HTML files: {self.html_dir}")
+            print(f"[CTS] CTS Port: {self.cts_port} @ {self.baud} baud")
+            print(f"[COM] Receiver Port: {self.receiver_port} @ 115200 baud")
+            print(f"[WS] WebSocket: ws://localhost:{self.WEBSOCKET_PORT}")
+            print("="*60)
+            print("\n[OK] System ready - monitoring CTS Gen7 and file receiver...")
+            print("="*60 + "\n")
+            
+            # This thread reads the CTS stream, so let it preempt background work
+            self._raise_reader_priority()
+            
+            cts_view = self._cts_view
+            cts_buf_size = len(cts_view)
             
             # Get initial state
             initial_event, initial_heat = self._get_event_and_heat()
@@ -6170,45 +7067,56 @@ window.addEventListener('beforeunload', () => {
                 if initial_race_time:
                     self._handle_time_update(initial_race_time)
             
-            # Main loop - continuous polling without blocking
+            # Bind hot-loop callables once instead of looking them up every iteration
+            cts_serial = None if self.test_mode else self.cts_serial  # No data in test mode
+            cts_readinto = None if cts_serial is None else cts_serial.readinto
+            process_bytes = self._process_bytes
+            get_event_and_heat = self._get_event_and_heat
+            get_race_time = self._get_race_time
+            handle_event_change = self._handle_event_change
+            handle_time_update = self._handle_time_update
+            handle_finish_times = self._handle_finish_times
+            check_lane_activity = self._check_lane_activity
+            request_obs_scene_lock = self._request_obs_scene_lock
+            sleep = time.sleep
+            monotonic = time.monotonic
+            lane_check_interval = self.LANE_CHECK_INTERVAL
+            obs_check_interval = self.OBS_CHECK_INTERVAL
+            next_lane_check = next_obs_check = 0.0
+            
             # Main loop - continuous polling without blocking
             while self.running:
-                # Read CTS data
-                if not self.test_mode:
-                    data = self.cts_serial.read(256)
-                else:
-                    data = b''  # Empty data in test mode
-                if data:
-                    buffer.extend(data)
-                    for byte_val in buffer:
-                        self._process_byte(byte_val)
-                    buffer.clear()
+                # Read only what has arrived, so the read never waits out the port timeout
+                if cts_serial is not None:
+                    waiting = cts_serial.in_waiting
+                    if waiting:
+                        n = cts_readinto(cts_view[:waiting] if waiting < cts_buf_size else cts_view)
+                        if n:
+                            process_bytes(cts_view[:n])
                 
                 # Check for changes
-                event, heat = self._get_event_and_heat()
-                race_time = self._get_race_time()
+                event, heat = get_event_and_heat()
+                race_time = get_race_time()
                 
                 if event != self.last_event or heat != self.last_heat:
-                    self._handle_event_change(event, heat)
+                    handle_event_change(event, heat)
                 
                 if race_time != self.last_race_time:
-                    self._handle_time_update(race_time)
-
-                self._handle_finish_times()
-
-                self._check_lane_activity()
-
-                # Check OBS scene lock every 100 iterations (~0.1 seconds)
-                if not hasattr(self, '_obs_check_counter'):
-                    self._obs_check_counter = 0
-
-                self._obs_check_counter += 1
-                if self._obs_check_counter >= 100:
-                    self._ensure_obs_scene_lock()
-                    self._obs_check_counter = 0
+                    handle_time_update(race_time)
+
+                handle_finish_times()
+
+                # Periodic housekeeping runs off deadlines on one monotonic clock read
+                now = monotonic()
+                if now >= next_lane_check:
+                    next_lane_check = now + lane_check_interval
+                    check_lane_activity()
+                if now >= next_obs_check:
+                    next_obs_check = now + obs_check_interval
+                    request_obs_scene_lock()
                 
                 # Very small sleep to prevent CPU spinning while remaining responsive
-                time.sleep(0.001)
+                sleep(0.001)
         
         except KeyboardInterrupt:
             print("\n[STOP] Stopping system...")
@@ -6219,10 +7127,32 @@ window.addEventListener('beforeunload', () => {
         finally:
             self.close()
     
+    def _raise_reader_priority(self) -> None:
+        """Best-effort: raise the calling thread's scheduling priority one step. Failures are only logged.
+
+        Only a mild bump: this loop also encodes JSON, touches files and logs, so a
+        real-time class could starve the WebSocket and COM threads on a single core.
+        """
+        try:
+            if sys.platform == "win32":
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                THREAD_PRIORITY_ABOVE_NORMAL = 1
+                if kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_ABOVE_NORMAL):
+                    print("[OK] CTS reader thread priority raised")
+            elif sys.platform.startswith("linux"):
+                # On Linux a thread id selects just that thread; lowering nice needs CAP_SYS_NICE
+                tid = threading.get_native_id()
+                os.setpriority(os.PRIO_PROCESS, tid, os.getpriority(os.PRIO_PROCESS, tid) - 1)
+                print("[OK] CTS reader thread priority raised")
+        except (OSError, AttributeError) as e:
+            print(f"[INFO] Could not raise CTS reader priority: {e}")
+    
     def close(self) -> None:
         """Clean up resources."""
         print("\n[SHUTDOWN] Shutting down...")
         self.running = False
+        self.obs_queue.put(None)  # Stop the OBS worker
         
         # Close serial connections
         try:
@@ -6239,8 +7169,12 @@ window.addEventListener('beforeunload', () => {
         except:
             pass
         
+        # Remove partial files from unfinished transfers
+        for name in list(self.com_buffers):
+            self._discard_com_transfer(name)
+        
         # Close WebSocket connections
-        for client in list(self.websocket_clients):
+        for client in list(self.websocket_clients) + list(self.split_clients):
             try:
                 asyncio.run(client.close())
             except:
@@ -6252,6 +7186,8 @@ window.addEventListener('beforeunload', () => {
 class COMPortSelector:
     """GUI for selecting COM ports."""
     
+    PORT_POLL_MS = 50  # How often the Tk thread checks for a finished port refresh
+    
     def __init__(self):
         self.selected_cts_port = None
         self.selected_receiver_port = None
@@ -6272,8 +7208,8 @@ class COMPortSelector:
         self.root.focus_force()
         self._create_widgets()
         
-    def _create_widgets(self):
-        """Create GUI widgets."""
+    def _create_widgets(self, ports: Optional[List[str]] = None):
+        """Create GUI widgets. Enumerates the COM ports unless a list is given."""
         # Title
         title_frame = tk.Frame(self.root, bg="#42008f", height=70)
         title_frame.pack(fill=tk.X)
@@ -6301,7 +7237,10 @@ class COMPortSelector:
         cts_label.pack(pady=(10, 5), anchor=tk.W)
         
         self.cts_port_var = tk.StringVar()
-        ports = self._get_available_ports()
+        if ports is None:
+            ports = self._get_available_ports()
+        self.cts_dropdown = None
+        self.receiver_dropdown = None
         
         if not ports:
             error_label = tk.Label(
@@ -6325,7 +7264,7 @@ class COMPortSelector:
             retry_btn.pack()
         else:
             self.cts_port_var.set(ports[0] if ports else "")
-            cts_dropdown = ttk.Combobox(
+            cts_dropdown = self.cts_dropdown = ttk.Combobox(
                 content_frame,
                 textvariable=self.cts_port_var,
                 values=ports,
@@ -6348,7 +7287,7 @@ class COMPortSelector:
             if receiver_ports:
                 self.receiver_port_var.set(receiver_ports[0])
             
-            receiver_dropdown = ttk.Combobox(
+            receiver_dropdown = self.receiver_dropdown = ttk.Combobox(
                 content_frame,
                 textvariable=self.receiver_port_var,
                 values=ports,
@@ -6430,10 +7369,42 @@ class COMPortSelector:
         return [port.device for port in ports]
     
     def _refresh_ports(self):
-        """Refresh the port list."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        self._create_widgets()
+        """Refresh the port list without blocking the UI.
+
+        Port enumeration can take hundreds of ms on Windows, so it runs in a
+        background thread. The thread never touches Tk: it hands the list over a
+        queue that the Tk thread polls.
+        """
+        result: queue.Queue = queue.Queue(maxsize=1)
+        threading.Thread(target=lambda: result.put(self._get_available_ports()), daemon=True).start()
+        self.root.after(self.PORT_POLL_MS, self._poll_ports, result)
+    
+    def _poll_ports(self, result: queue.Queue):
+        """Apply the enumerated ports once the worker has finished (runs on the Tk thread)."""
+        try:
+            ports = result.get_nowait()
+        except queue.Empty:
+            self.root.after(self.PORT_POLL_MS, self._poll_ports, result)
+            return
+        self._apply_ports(ports)
+    
+    def _apply_ports(self, ports: List[str]):
+        """Update the dropdowns in place, rebuilding only if the layout must change."""
+        if not ports or self.cts_dropdown is None:
+            for widget in self.root.winfo_children():
+                widget.destroy()
+            self._create_widgets(ports)
+            return
+        
+        self.cts_dropdown['values'] = ports
+        self.receiver_dropdown['values'] = ports
+        if self.cts_port_var.get() not in ports:
+            self.cts_port_var.set(ports[0])
+        
+        # Like _create_widgets, a lost receiver selection never defaults to the CTS port
+        if self.receiver_port_var.get() not in ports:
+            receiver_ports = [p for p in ports if p != self.cts_port_var.get()]
+            self.receiver_port_var.set(receiver_ports[0] if receiver_ports else "")
     
     def _on_start(self):
         """Handle start button click."""
@@ -0,0 +1,55 @@
+import base64
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from SwimLive import SwimLiveSystem
+
+
+def _packet(name, seq=None, content=b"", final=False):
+    header = {"name": name, "final": final}
+    if not final:
+        header["seq"] = seq
+        header["content"] = base64.b64encode(content).decode("ascii")
+    return json.dumps(header).encode("utf-8")
+
+
+class ComTransferTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        # Only the COM receiver state is needed; skip the serial/OBS setup in __init__
+        self.system = SwimLiveSystem.__new__(SwimLiveSystem)
+        self.system.event_files_path = Path(self._tmp.name)
+        self.system.com_buffers = {}
+        self.system.event_cache = {}
+        self.system.swimmer_cache = {}
+        self.system.heat_cache = {}
+
+    def _receive(self, *packets):
+        for packet in packets:
+            self.system._process_com_packet(packet)
+
+    def test_reordered_chunks_are_written_in_sequence_order(self):
+        self._receive(
+            _packet("E1.scb", 1, b"BBB"),
+            _packet("E1.scb", 0, b"AAA"),
+            _packet("E1.scb", 2, b"CCC"),
+            _packet("E1.scb", final=True),
+        )
+        self.assertEqual((Path(self._tmp.name) / "E1.scb").read_bytes(), b"AAABBBCCC")
+        self.assertEqual(self.system.com_buffers, {})
+
+    def test_retransmitted_chunk_is_written_once(self):
+        self._receive(
+            _packet("E2.scb", 0, b"AAA"),
+            _packet("E2.scb", 0, b"AAA"),
+            _packet("E2.scb", 1, b"BBB"),
+            _packet("E2.scb", final=True),
+        )
+        self.assertEqual((Path(self._tmp.name) / "E2.scb").read_bytes(), b"AAABBB")
+
+
+if __name__ == "__main__":
+    unittest.main()